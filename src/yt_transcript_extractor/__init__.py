@@ -5,6 +5,7 @@ Public API:
     extract()               High-level one-call interface (URL → formatted output).
     get_transcript()        Fetch raw transcript segments for a video ID.
     parse_video_id()        Parse a YouTube URL or validate a bare video ID.
+    VideoID                 str subclass marking an already-parsed video ID.
     fetch_video_metadata()  Fetch video/channel metadata via yt-dlp.
     TranscriptStore         DuckDB-backed storage for transcripts.
     VideoMetadata           Dataclass holding video metadata fields.
@@ -25,11 +26,8 @@ Usage:
     text = extract("https://www.youtube.com/watch?v=dQw4w9WgXcQ", save=True)
 """
 
-from yt_transcript_extractor.extractor import (
-    extract,
-    get_transcript,
-    parse_video_id,
-)
+import importlib
+
 from yt_transcript_extractor.errors import (
     LanguageNotAvailableError,
     MetadataFetchError,
@@ -38,17 +36,49 @@ from yt_transcript_extractor.errors import (
     TranscriptUnavailableError,
     VideoNotFoundError,
 )
-from yt_transcript_extractor.metadata import (
-    VideoMetadata,
-    fetch_video_metadata,
-)
-from yt_transcript_extractor.storage import TranscriptStore
+
+# The remaining re-exports are resolved lazily (PEP 562).  metadata pulls in
+# yt-dlp and storage pulls in DuckDB — both expensive C-extension imports —
+# and eager re-exports would make every consumer pay for them just to reach
+# the errors module (the CLI imports TranscriptError on every invocation,
+# including --help).  Attribute name → defining module:
+_LAZY_ATTRS = {
+    "extract": "yt_transcript_extractor.extractor",
+    "get_transcript": "yt_transcript_extractor.extractor",
+    "parse_video_id": "yt_transcript_extractor.extractor",
+    "VideoID": "yt_transcript_extractor.extractor",
+    "fetch_video_metadata": "yt_transcript_extractor.metadata",
+    "fetch_video_metadata_cached": "yt_transcript_extractor.metadata",
+    "VideoMetadata": "yt_transcript_extractor.metadata",
+    "TranscriptStore": "yt_transcript_extractor.storage",
+}
+
+
+def __getattr__(name: str):
+    """Resolve the lazy re-exports on first access and cache them."""
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    attr = getattr(importlib.import_module(module_name), name)
+    # Cache in the module namespace so later lookups bypass __getattr__.
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list[str]:
+    """Include the lazy re-exports so dir()/completion still lists them."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     "extract",
     "get_transcript",
     "parse_video_id",
+    "VideoID",
     "fetch_video_metadata",
+    "fetch_video_metadata_cached",
     "TranscriptStore",
     "VideoMetadata",
     "TranscriptError",
@@ -0,0 +1,22 @@
+"""
+__main__.py — entry point for `python -m yt_transcript_extractor`.
+
+Fast-paths `-V`/`--version` before importing cli.py: shell prompts and
+CI health checks probe the version constantly, and answering from
+importlib.metadata alone skips Click and the whole command machinery.
+(Running `-m` always executes the package __init__ first — that's
+unavoidable — but its re-exports are lazy, so it only costs the errors
+module, not yt-dlp or DuckDB.)
+"""
+
+import sys
+
+if sys.argv[1:] in (["-V"], ["--version"]):
+    from importlib.metadata import version
+
+    print(f"yt-transcript, version {version('yt-transcript-extractor')}")
+    sys.exit(0)
+
+from yt_transcript_extractor.cli import main
+
+main()
@@ -6,6 +6,7 @@ querying locally-saved transcripts organized by channel.
 
 Endpoints:
     GET /transcript/{video_id}          — Fetch a transcript (text or JSON), optionally saving it.
+    POST /batch                         — Fetch transcripts for many videos in one request.
     GET /channels                       — List all channels with saved transcripts.
     GET /channels/{channel_id}/videos   — List saved videos for a specific channel.
     GET /saved/{video_id}               — Retrieve a previously saved transcript.
@@ -21,11 +22,28 @@ the appropriate HTTP response using the status code stored on the exception.
 
 from __future__ import annotations
 
-from fastapi import FastAPI, Query, Request
-from fastapi.responses import JSONResponse, PlainTextResponse
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import duckdb
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
 
 from yt_transcript_extractor.errors import TranscriptError
-from yt_transcript_extractor.extractor import extract
+from yt_transcript_extractor.extractor import (
+    _fetch_transcript_with_metadata,
+    extract,
+    format_doc,
+    format_json,
+    format_text,
+)
 from yt_transcript_extractor.storage import TranscriptStore
 
 # ---------------------------------------------------------------------------
@@ -35,24 +53,200 @@ from yt_transcript_extractor.storage import TranscriptStore
 # Default DuckDB database path, shared across all endpoints that access storage.
 _DEFAULT_DB = "transcripts.duckdb"
 
+# Databases the API may open.  `db` arrives as a client-supplied query
+# parameter, so without a bound any client could make the server open (and
+# create) arbitrary DuckDB files and hold their connections for the life of
+# the process.  Only the default database is served unless the operator
+# explicitly lists more paths in YT_TRANSCRIPT_DBS (os.pathsep-separated).
+_ALLOWED_DBS = frozenset(
+    filter(None, os.environ.get("YT_TRANSCRIPT_DBS", "").split(os.pathsep))
+) | {_DEFAULT_DB}
+
+# Worker threads for blocking work (yt-dlp, transcript fetch, DuckDB).
+# Each request spends most of its time waiting on network or disk, so a
+# modest pool is enough to keep the event loop responsive under load.
+_EXECUTOR_MAX_WORKERS = 8
+
+# DuckDB session tuning applied to the default database at startup.  Thread
+# count is capped well below the executor size (queries here are small), and
+# the memory limit keeps a pathological query from ballooning the process.
+_DUCKDB_THREADS = 4
+_DUCKDB_MEMORY_LIMIT = "2GB"
+
 # ---------------------------------------------------------------------------
 # App setup
 # ---------------------------------------------------------------------------
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Install a bounded thread pool as the event loop's default executor.
+
+    All blocking work (extract(), TranscriptStore queries) is dispatched via
+    run_in_executor, so sizing the default executor here caps how many
+    blocking operations run concurrently.  The pool and any cached database
+    connections are shut down cleanly on application exit.
+    """
+    executor = ThreadPoolExecutor(max_workers=_EXECUTOR_MAX_WORKERS)
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(executor)
+    # Warm the default database before serving: opening the connection and
+    # loading the catalog in TranscriptStore.__init__ here moves that
+    # one-time cost out of the first request that touches storage.
+    await loop.run_in_executor(None, _warm_default_store)
+    try:
+        yield
+    finally:
+        executor.shutdown(wait=False)
+        _close_stores()
+
+
+# ---------------------------------------------------------------------------
+# Store caching
+# ---------------------------------------------------------------------------
+
+# Open stores keyed by database path.  The key space is bounded by
+# _ALLOWED_DBS (validated in _get_store), so entries are never evicted —
+# they live until _close_stores() at shutdown.  An LRU here would have to
+# close stores on eviction, which could yank the connection out from under
+# an in-flight streaming response.
+_stores: dict[str, TranscriptStore] = {}
+
+# Serializes access to cached stores: a DuckDB connection isn't safe for
+# concurrent use from multiple executor threads.  Queries here are short
+# local reads, so serializing them costs far less than the per-request
+# connection open (WAL check + catalog load) this cache removes.
+_store_lock = threading.Lock()
+
+
+def _get_store(db: str) -> TranscriptStore:
+    """
+    Return a long-lived TranscriptStore for the given database path.
+
+    Opening a DuckDB connection involves WAL checks and catalog loading, so
+    the connection is opened once per database path and reused across
+    requests instead of being re-opened by every endpoint call.  Paths
+    outside the operator's allowlist are rejected with a 400 before any
+    file is touched.  Callers must hold _store_lock.
+    """
+    if db not in _ALLOWED_DBS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"unknown database {db!r}; "
+            "allowed values are set by the server operator",
+        )
+    store = _stores.get(db)
+    if store is None:
+        store = _stores[db] = TranscriptStore(db)
+    return store
+
+
+def _close_stores() -> None:
+    """Close every cached store and reset the cache (called on shutdown)."""
+    for store in _stores.values():
+        store.close()
+    _stores.clear()
+
+
+def _warm_default_store() -> None:
+    """
+    Open and tune the default database (blocking; called once at startup).
+
+    DuckDB loads extensions and its catalog lazily, so the first query after
+    process start otherwise pays a latency spike.  The PRAGMAs bound the
+    connection's parallelism and memory for the life of the process.
+    """
+    with _store_lock:
+        store = _get_store(_DEFAULT_DB)
+        try:
+            store.conn.execute(
+                f"PRAGMA threads={_DUCKDB_THREADS}; "
+                f"PRAGMA memory_limit='{_DUCKDB_MEMORY_LIMIT}';"
+            )
+        except duckdb.Error:
+            # Tuning is best-effort — an older DuckDB rejecting a PRAGMA
+            # shouldn't stop the API from serving.
+            pass
+
+
+# In-flight /transcript fetches, keyed by the full request parameters.
+# Concurrent requests for the same key await the same Future instead of
+# each triggering an independent yt-dlp + transcript fetch.
+_inflight: dict[tuple, asyncio.Future] = {}
+_inflight_lock = asyncio.Lock()
+
+# Strong references to the background extraction tasks — the event loop
+# only holds weak ones, so without this a task could be garbage-collected
+# mid-flight.  Tasks remove themselves on completion.
+_extraction_tasks: set[asyncio.Task] = set()
+
+
+def _extract_and_save(
+    video_id: str,
+    languages: list[str] | None,
+    fmt: str,
+    db: str,
+) -> str | dict:
+    """
+    Fetch one transcript and persist it through the shared store (blocking).
+
+    extract(save=True) opens a fresh DuckDB connection per call, which
+    bypasses both the operator allowlist and the cached per-path store —
+    and concurrent per-call connections writing the same file abort each
+    other with catalog write-write conflicts.  Here the network fetches
+    still overlap freely across worker threads, but persistence goes
+    through _get_store under _store_lock, so saves serialise on the one
+    long-lived connection like every other storage access.
+    """
+    transcript, metadata = _fetch_transcript_with_metadata(video_id, languages)
+    with _store_lock:
+        _get_store(db).save_transcript(video_id, transcript, metadata)
+
+    # Same format dispatch as extract()'s tail.
+    if fmt == "json":
+        return format_json(transcript, video_id)
+    if fmt == "doc":
+        return format_doc(transcript, title=metadata.title)
+    return format_text(transcript)
+
+
+async def _run_sync(func, /, *args, **kwargs):
+    """
+    Run a blocking callable in the default executor and await its result.
+
+    Every endpoint calls into synchronous code (network I/O in extract(),
+    DuckDB queries in TranscriptStore) — running it on the event loop would
+    block all other requests for the duration.  Offloading to a worker
+    thread restores true request concurrency.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
 app = FastAPI(
     title="YouTube Transcript Extractor API",
     description="Extract YouTube video transcripts as plain text or structured JSON. "
                 "Supports saving transcripts locally for offline retrieval and search.",
     version="0.2.0",
+    lifespan=_lifespan,
+    # orjson serializes large segment payloads several times faster than the
+    # stdlib json encoder FastAPI uses by default.
+    default_response_class=ORJSONResponse,
 )
 
+# Transcript payloads are redundant natural-language text and compress 4-8x,
+# so gzip the larger responses.  minimum_size skips tiny payloads where the
+# header overhead would outweigh the savings; level 5 trades a little ratio
+# for noticeably less CPU than the default 9.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # ---------------------------------------------------------------------------
 # Global error handler
 # ---------------------------------------------------------------------------
 
 @app.exception_handler(TranscriptError)
-async def transcript_error_handler(request: Request, exc: TranscriptError) -> JSONResponse:
+async def transcript_error_handler(request: Request, exc: TranscriptError) -> ORJSONResponse:
     """
     Translate any TranscriptError (or subclass) into an HTTP error response.
 
@@ -62,7 +256,7 @@ async def transcript_error_handler(request: Request, exc: TranscriptError) -> JS
     This covers all error subclasses including MetadataFetchError (502) and
     StorageError (500).
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.http_status,
         content={"error": exc.message},
     )
@@ -73,7 +267,7 @@ async def transcript_error_handler(request: Request, exc: TranscriptError) -> JS
 # ---------------------------------------------------------------------------
 
 # response_model=None is required because we return different Response subclasses
-# (PlainTextResponse or JSONResponse) depending on the format param, and FastAPI
+# (PlainTextResponse or ORJSONResponse) depending on the format param, and FastAPI
 # can't build a Pydantic model from a Union of Response types.
 @app.get("/transcript/{video_id}", response_model=None)
 async def get_transcript(
@@ -95,7 +289,7 @@ async def get_transcript(
         default=_DEFAULT_DB,
         description="Path to the DuckDB database file (only used when save=true).",
     ),
-) -> PlainTextResponse | JSONResponse:
+) -> PlainTextResponse | ORJSONResponse:
     """
     Fetch the transcript for a single YouTube video.
 
@@ -115,43 +309,260 @@ async def get_transcript(
     if lang:
         languages = [code.strip() for code in lang.split(",")]
 
-    # extract() may raise TranscriptError subclasses — the global handler
-    # will convert those into the correct HTTP error response.
-    result = extract(
-        video_id,
-        languages=languages,
-        fmt=format,
-        save=save,
-        db_path=db if save else None,
-    )
+    # Coalesce concurrent requests for identical parameters: the first one
+    # in becomes the "owner" and performs the actual fetch; everyone else
+    # awaits the same Future and shares its result (or exception).  The key
+    # includes save/db so a save=true request never piggybacks on a fetch
+    # that skipped persistence.
+    key = (video_id, tuple(languages) if languages else None, format, save, db if save else None)
+    async with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = asyncio.get_running_loop().create_future()
+            _inflight[key] = future
+
+    if is_owner:
+        # The extraction runs in its own task, not in this handler: if the
+        # owning client disconnects, Starlette cancels the handler task,
+        # and completing the shared future from here would hand that
+        # CancelledError to every coalesced waiter.  A separate task is
+        # only cancelled by its own lifecycle, so the fetch runs to
+        # completion for whoever is still listening.
+        async def _fill_future() -> None:
+            try:
+                # extract() may raise TranscriptError subclasses — the
+                # global handler converts those into the correct HTTP error
+                # response in each awaiting request.  It performs blocking
+                # network I/O, so it runs in a worker thread.  Saving
+                # routes through the shared store so the db allowlist and
+                # write serialisation apply.
+                if save:
+                    result = await _run_sync(
+                        _extract_and_save, video_id, languages, format, db,
+                    )
+                else:
+                    result = await _run_sync(
+                        extract, video_id, languages=languages, fmt=format,
+                    )
+            except BaseException as exc:
+                future.set_exception(exc)
+                # Mark the exception as retrieved so a failure with no
+                # surviving waiters doesn't log a spurious warning.
+                future.exception()
+            else:
+                future.set_result(result)
+            finally:
+                async with _inflight_lock:
+                    _inflight.pop(key, None)
+
+        task = asyncio.get_running_loop().create_task(_fill_future())
+        _extraction_tasks.add(task)
+        task.add_done_callback(_extraction_tasks.discard)
+
+    # Owner and waiters alike await through shield(): cancelling this
+    # request only abandons its own await — the shared future (and the
+    # extraction task feeding it) lives on for the other coalesced
+    # requests.
+    result = await asyncio.shield(future)
 
     # Return plain text or JSON depending on the requested format.
     if isinstance(result, dict):
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
     return PlainTextResponse(content=result)
 
 
+# ---------------------------------------------------------------------------
+# Endpoints — batch transcript fetching
+# ---------------------------------------------------------------------------
+
+# Upper bound on videos per batch request, so one call can't tie up the
+# worker pool indefinitely.
+_BATCH_MAX_ITEMS = 50
+
+# How many extractions a single batch runs concurrently.  Kept below the
+# executor size so a batch leaves worker threads free for other requests.
+_BATCH_MAX_CONCURRENCY = 4
+
+
+class BatchItem(BaseModel):
+    """One transcript request inside a POST /batch body."""
+
+    video_id: str
+    format: str = Field(default="text", pattern="^(text|json|doc)$")
+    lang: str = ""
+    save: bool = False
+
+
+class BatchRequest(BaseModel):
+    """Body schema for POST /batch."""
+
+    requests: list[BatchItem] = Field(min_length=1, max_length=_BATCH_MAX_ITEMS)
+
+
+@app.post("/batch")
+async def batch_transcripts(
+    batch: BatchRequest,
+    db: str = Query(
+        default=_DEFAULT_DB,
+        description="Path to the DuckDB database file (only used for items with save=true).",
+    ),
+) -> ORJSONResponse:
+    """
+    Fetch transcripts for up to 50 videos in a single request.
+
+    Items run concurrently (bounded by an internal semaphore), so one batch
+    call replaces N round-trips to `/transcript/{video_id}`.  The response
+    pairs each item with its own status:
+
+        {"responses": [{"id": 0, "status": 200, "body": ...}, ...]}
+
+    A failed item gets its error status and `{"error": ...}` body without
+    affecting the other items.  `id` is the item's index in the request.
+    """
+    semaphore = asyncio.Semaphore(_BATCH_MAX_CONCURRENCY)
+
+    async def run_one(index: int, item: BatchItem) -> dict:
+        # Same parameter handling as the single-video endpoint.
+        languages: list[str] | None = None
+        if item.lang:
+            languages = [code.strip() for code in item.lang.split(",")]
+
+        async with semaphore:
+            try:
+                # Items that save route through the shared store (allowlist
+                # check, serialised writes); fetch-only items call extract()
+                # directly.
+                if item.save:
+                    result = await _run_sync(
+                        _extract_and_save, item.video_id, languages, item.format, db,
+                    )
+                else:
+                    result = await _run_sync(
+                        extract, item.video_id, languages=languages, fmt=item.format,
+                    )
+            except TranscriptError as exc:
+                # Per-item errors are reported in place — the batch itself
+                # still succeeds, matching the standard batch-response shape.
+                return {"id": index, "status": exc.http_status, "body": {"error": exc.message}}
+        return {"id": index, "status": 200, "body": result}
+
+    responses = await asyncio.gather(
+        *(run_one(i, item) for i, item in enumerate(batch.requests)),
+    )
+    return ORJSONResponse(content={"responses": list(responses)})
+
+
 # ---------------------------------------------------------------------------
 # Endpoints — saved transcript queries
 # ---------------------------------------------------------------------------
 
+# Synchronous DB helpers.  DuckDB calls block on disk I/O, so each endpoint
+# wraps its store access in one of these and dispatches it to a worker thread
+# via _run_sync — the async handler itself never touches the database.  All
+# helpers go through the cached store under _store_lock.
+
+def _query_channels(db: str, limit: int, offset: int):
+    """List a page of channels (blocking; runs in executor)."""
+    with _store_lock:
+        return _get_store(db).list_channels(limit, offset)
+
+
+def _query_videos(db: str, channel_id: str, limit: int, offset: int):
+    """List a page of a channel's videos (blocking; runs in executor)."""
+    with _store_lock:
+        return _get_store(db).list_videos(channel_id, limit, offset)
+
+
+def _query_saved(db: str, video_id: str, format: str):
+    """
+    Fetch a saved transcript in the requested format.
+
+    Returns None if the video isn't in the database, a list of segment dicts
+    for format="json", or a string for "doc".  The "text" format streams via
+    _stream_saved_text instead.  Blocking; runs in executor.
+    """
+    with _store_lock:
+        store = _get_store(db)
+        if not store.has_video(video_id):
+            return None
+        if format == "json":
+            return store.get_transcript(video_id)
+        else:
+            return store.get_transcript_doc(video_id)
+
+
+def _query_saved_etag(db: str, video_id: str, format: str) -> str | None:
+    """
+    Build the ETag for a saved transcript, or None if it isn't stored.
+
+    Saved transcripts are immutable, so the store's content hash plus the
+    requested format (each format has a different body) makes a strong
+    validator.  Blocking; runs in executor.
+    """
+    with _store_lock:
+        store = _get_store(db)
+        if not store.has_video(video_id):
+            return None
+        content_hash = store.get_transcript_hash(video_id)
+    if content_hash is None:
+        return None
+    return f'"{content_hash}-{format}"'
+
+
+def _stream_saved_text(db: str, video_id: str):
+    """
+    Yield a saved transcript's plain text in bounded chunks.
+
+    Wraps TranscriptStore.iter_transcript_text so the store lock is held
+    only while fetching each batch, not for the whole response — other
+    requests can interleave between chunks while this one streams.
+    """
+    chunks = None
+    while True:
+        with _store_lock:
+            if chunks is None:
+                chunks = _get_store(db).iter_transcript_text(video_id)
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                return
+        yield chunk
+
+
+def _query_search(db: str, query: str, limit: int, offset: int):
+    """Search a page of transcripts (blocking; runs in executor)."""
+    with _store_lock:
+        return _get_store(db).search_transcripts(query, limit, offset)
+
+
 @app.get("/channels")
 async def list_channels(
     db: str = Query(
         default=_DEFAULT_DB,
         description="Path to the DuckDB database file.",
     ),
-) -> JSONResponse:
+    limit: int = Query(
+        default=100, ge=1, le=1000,
+        description="Maximum number of channels per page.",
+    ),
+    offset: int = Query(
+        default=0, ge=0,
+        description="Number of channels to skip (for paging).",
+    ),
+) -> ORJSONResponse:
     """
-    List all channels that have saved transcripts.
+    List channels that have saved transcripts, one page at a time.
 
     Returns an array of channel objects, each with the channel's name, ID,
-    URL, and the number of saved videos.
+    URL, and the number of saved videos.  When more results exist beyond
+    this page, the response includes `next_offset` to pass back as `offset`.
     """
-    with TranscriptStore(db) as store:
-        channel_list = store.list_channels()
+    # Fetch one extra row beyond the page to detect whether more exist.
+    channel_list = await _run_sync(_query_channels, db, limit + 1, offset)
+    truncated = len(channel_list) > limit
 
-    return JSONResponse(content={
+    content: dict = {
         "channels": [
             {
                 "channel_id": ch.channel_id,
@@ -159,9 +570,12 @@ async def list_channels(
                 "channel_url": ch.channel_url,
                 "video_count": ch.video_count,
             }
-            for ch in channel_list
+            for ch in channel_list[:limit]
         ],
-    })
+    }
+    if truncated:
+        content["next_offset"] = offset + limit
+    return ORJSONResponse(content=content)
 
 
 @app.get("/channels/{channel_id}/videos")
@@ -171,17 +585,27 @@ async def list_videos(
         default=_DEFAULT_DB,
         description="Path to the DuckDB database file.",
     ),
-) -> JSONResponse:
+    limit: int = Query(
+        default=100, ge=1, le=1000,
+        description="Maximum number of videos per page.",
+    ),
+    offset: int = Query(
+        default=0, ge=0,
+        description="Number of videos to skip (for paging).",
+    ),
+) -> ORJSONResponse:
     """
-    List all saved videos for a specific channel.
+    List saved videos for a specific channel, one page at a time.
 
     **channel_id** is YouTube's internal channel identifier (e.g. `UC38IQsAvIsxxjztdMZQtwHA`).
-    Use the `/channels` endpoint to discover channel IDs.
+    Use the `/channels` endpoint to discover channel IDs.  When more results
+    exist beyond this page, the response includes `next_offset`.
     """
-    with TranscriptStore(db) as store:
-        video_list = store.list_videos(channel_id)
+    # Fetch one extra row beyond the page to detect whether more exist.
+    video_list = await _run_sync(_query_videos, db, channel_id, limit + 1, offset)
+    truncated = len(video_list) > limit
 
-    return JSONResponse(content={
+    content: dict = {
         "channel_id": channel_id,
         "videos": [
             {
@@ -193,13 +617,17 @@ async def list_videos(
                 "language_code": v.language_code,
                 "is_generated": v.is_generated,
             }
-            for v in video_list
+            for v in video_list[:limit]
         ],
-    })
+    }
+    if truncated:
+        content["next_offset"] = offset + limit
+    return ORJSONResponse(content=content)
 
 
 @app.get("/saved/{video_id}", response_model=None)
 async def get_saved_transcript(
+    request: Request,
     video_id: str,
     format: str = Query(
         default="text",
@@ -210,35 +638,63 @@ async def get_saved_transcript(
         default=_DEFAULT_DB,
         description="Path to the DuckDB database file.",
     ),
-) -> PlainTextResponse | JSONResponse:
+) -> PlainTextResponse | ORJSONResponse:
     """
     Retrieve a previously saved transcript from the local database.
 
     This does NOT fetch from YouTube — it only reads from the local DuckDB
     store.  Use the `GET /transcript/{video_id}?save=true` endpoint to save
     a transcript first.
-    """
-    with TranscriptStore(db) as store:
-        if not store.has_video(video_id):
-            return JSONResponse(
-                status_code=404,
-                content={"error": f"Video {video_id} not found in database."},
-            )
 
-        if format == "json":
-            segments = store.get_transcript(video_id)
-            return JSONResponse(content={
+    Responses carry a strong ETag (saved transcripts are immutable), so
+    clients sending `If-None-Match` get a bodiless 304 on repeat requests.
+    """
+    # The ETag doubles as the existence check: None means the video (or its
+    # transcript) isn't stored.  On a conditional match we answer 304 before
+    # touching the transcript body at all.
+    etag = await _run_sync(_query_saved_etag, db, video_id, format)
+
+    if etag is None:
+        return ORJSONResponse(
+            status_code=404,
+            content={"error": f"Video {video_id} not found in database."},
+        )
+
+    cache_headers = {"ETag": etag, "Cache-Control": "public, max-age=86400"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+
+    # The text format streams segment batches as they're read from DuckDB,
+    # so first bytes go out before the whole transcript is assembled and
+    # peak memory stays bounded for multi-hour videos.
+    if format == "text":
+        return StreamingResponse(
+            _stream_saved_text(db, video_id),
+            media_type="text/plain; charset=utf-8",
+            headers=cache_headers,
+        )
+
+    result = await _run_sync(_query_saved, db, video_id, format)
+
+    if result is None:
+        return ORJSONResponse(
+            status_code=404,
+            content={"error": f"Video {video_id} not found in database."},
+        )
+
+    if format == "json":
+        return ORJSONResponse(
+            content={
                 "video_id": video_id,
-                "segment_count": len(segments),
-                "segments": segments,
-            })
-        elif format == "doc":
-            # Readable markdown document with timestamped paragraphs.
-            text = store.get_transcript_doc(video_id)
-            return PlainTextResponse(content=text)
-        else:
-            text = store.get_transcript_text(video_id)
-            return PlainTextResponse(content=text)
+                "segment_count": len(result),
+                "segments": result,
+            },
+            headers=cache_headers,
+        )
+    # "doc" (readable HTML document) comes back as a single string — it
+    # needs full paragraph grouping before the template wraps it, so it
+    # can't stream segment-by-segment.
+    return PlainTextResponse(content=result, headers=cache_headers)
 
 
 @app.get("/search")
@@ -250,21 +706,36 @@ async def search_transcripts(
         default=_DEFAULT_DB,
         description="Path to the DuckDB database file.",
     ),
-) -> JSONResponse:
+    limit: int = Query(
+        default=100, ge=1, le=1000,
+        description="Maximum number of matches per page.",
+    ),
+    offset: int = Query(
+        default=0, ge=0,
+        description="Number of matches to skip (for paging).",
+    ),
+) -> ORJSONResponse:
     """
     Search across all saved transcripts for matching segments.
 
     Returns an array of matching segments, each with the video context
-    (title, channel name) and timestamp information.
+    (title, channel name) and timestamp information, one page at a time.
+    When more results exist beyond this page, the response includes
+    `next_offset`.
     """
-    with TranscriptStore(db) as store:
-        results = store.search_transcripts(q)
+    # Fetch one extra row beyond the page to detect whether more exist.
+    results = await _run_sync(_query_search, db, q, limit + 1, offset)
+    truncated = len(results) > limit
+    results = results[:limit]
 
-    return JSONResponse(content={
+    content: dict = {
         "query": q,
         "result_count": len(results),
         "results": results,
-    })
+    }
+    if truncated:
+        content["next_offset"] = offset + limit
+    return ORJSONResponse(content=content)
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,50 @@
+"""
+cli_channels.py — the `channels` subcommand.
+
+Loaded on demand by the LazyGroup in cli.py, so other invocations don't
+pay for the DuckDB import this command needs.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+from yt_transcript_extractor.cli import _DEFAULT_DB, _open_store
+from yt_transcript_extractor.errors import TranscriptError
+
+
+@click.command()
+@click.option(
+    "--db",
+    default=_DEFAULT_DB,
+    show_default=True,
+    help="Path to the DuckDB database file.",
+)
+@click.pass_context
+def channels(ctx: click.Context, db: str) -> None:
+    """
+    List all channels that have saved transcripts.
+
+    Shows each channel's name, ID, and the number of saved videos.
+    """
+    try:
+        with _open_store(ctx, db) as store:
+            channel_list = store.list_channels()
+    except TranscriptError as exc:
+        click.echo(f"Error: {exc.message}", err=True)
+        sys.exit(1)
+
+    if not channel_list:
+        click.echo("No saved channels found. Use 'yt-transcript get --save' to save transcripts.")
+        return
+
+    # Display channels in a readable format with video counts.
+    for ch in channel_list:
+        video_word = "video" if ch.video_count == 1 else "videos"
+        click.echo(f"{ch.channel_name} ({ch.video_count} {video_word})")
+        click.echo(f"  ID: {ch.channel_id}")
+        if ch.channel_url:
+            click.echo(f"  URL: {ch.channel_url}")
+        click.echo()
@@ -0,0 +1,321 @@
+"""
+cli_get.py — the `get` and `get-many` subcommands.
+
+Loaded on demand by the LazyGroup in cli.py, so invocations that never
+fetch from YouTube don't pay for this module's imports.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import sys
+
+from pathlib import Path
+
+import click
+import orjson
+
+from yt_transcript_extractor.cli import _DEFAULT_DB, _auto_output_path, _json_options
+from yt_transcript_extractor.errors import TranscriptError
+
+
+# ---------------------------------------------------------------------------
+# Subcommand: get — fetch a transcript from YouTube
+# ---------------------------------------------------------------------------
+
+@click.command()
+@click.argument("video", metavar="URL_OR_ID")
+@click.option(
+    "--format", "-f",
+    "fmt",                           # avoid shadowing the builtin "format"
+    type=click.Choice(["text", "json", "doc"], case_sensitive=False),
+    default="doc",
+    show_default=True,
+    help="Output format: plain text, JSON with timestamps, or readable markdown document.",
+)
+@click.option(
+    "--lang", "-l",
+    default=None,
+    help="Comma-separated language codes in priority order (e.g. 'de,en'). Defaults to English.",
+)
+@click.option(
+    "--output", "-o",
+    type=click.Path(),
+    default=None,
+    help="Write output to a file instead of stdout.",
+)
+@click.option(
+    "--save/--no-save",
+    default=True,
+    show_default=True,
+    help="Save the transcript to a local DuckDB database for offline access.",
+)
+@click.option(
+    "--pretty/--compact",
+    "pretty",
+    default=None,
+    help="Force pretty or compact JSON output. Default: pretty on a terminal, compact when piped.",
+)
+@click.option(
+    "--db",
+    default=_DEFAULT_DB,
+    show_default=True,
+    help="Path to the DuckDB database file (only used with --save).",
+)
+def get(
+    video: str,
+    fmt: str,
+    lang: str | None,
+    output: str | None,
+    save: bool,
+    pretty: bool | None,
+    db: str,
+) -> None:
+    """
+    Fetch a YouTube video transcript.
+
+    VIDEO can be a full YouTube URL or an 11-character video ID.
+    By default, saves to the local DB and writes a markdown document to
+    ~/Documents/yt-transcripts/{channel}/{title}.html.
+    Use --no-save to skip DB persistence, or --format text/json for stdout.
+    """
+    from yt_transcript_extractor.extractor import extract, parse_video_id
+
+    # Parse the comma-separated language list into a proper list, if provided.
+    languages: list[str] | None = None
+    if lang:
+        languages = [code.strip() for code in lang.split(",")]
+
+    try:
+        # Parse the URL/ID once up front — the canonical 11-char ID is needed
+        # again later for the auto-output path, and extract() accepts a bare
+        # ID directly, so there's no reason to parse twice.
+        video_id = parse_video_id(video)
+
+        # metadata_cache=True skips the yt-dlp metadata fetch for videos seen
+        # within the last day — repeated `yt-transcript get` runs on the same
+        # video only pay for the transcript fetch.
+        result = extract(
+            video_id,
+            languages=languages,
+            fmt=fmt,
+            save=save,
+            db_path=db if save else None,
+            metadata_cache=True,
+        )
+    except TranscriptError as exc:
+        # Print a clean, human-readable error message to stderr and exit with
+        # a non-zero code.  We don't dump a traceback — it's not helpful for
+        # end-users and the exception message already says what went wrong.
+        click.echo(f"Error: {exc.message}", err=True)
+        sys.exit(1)
+
+    if save:
+        click.echo(f"Transcript saved to {db}", err=True)
+
+    # JSON output goes out as the raw orjson bytes — decoding to str and
+    # re-encoding on write would double peak memory for transcripts with
+    # thousands of segments.  JSON never takes the auto-path branch (that's
+    # doc-only), so only the file and stdout destinations matter here.
+    if isinstance(result, dict):
+        payload = orjson.dumps(result, option=_json_options(pretty, output))
+        if output:
+            Path(output).write_bytes(payload)
+            click.echo(f"Transcript written to {output}", err=True)
+        else:
+            click.get_binary_stream("stdout").write(payload)
+        return
+
+    text = result
+
+    # Write to file or stdout.
+    if output:
+        # Explicit --output given — write to that exact path.
+        Path(output).write_text(text + "\n", encoding="utf-8")
+        click.echo(f"Transcript written to {output}", err=True)
+    elif fmt == "doc" and save:
+        # Auto-path mode: doc format + save is on + no explicit --output.
+        # Reuse the video_id parsed up front to look up metadata.
+        auto_path = _auto_output_path(video_id, db)
+
+        if auto_path:
+            # Create the directory tree (e.g. ~/Documents/yt-transcripts/Channel/)
+            # if it doesn't exist yet.
+            os.makedirs(os.path.dirname(auto_path), exist_ok=True)
+            # One write_text call instead of two buffered writes — fewer
+            # syscalls, which adds up for multi-MB doc outputs.
+            Path(auto_path).write_text(text + "\n", encoding="utf-8")
+            click.echo(f"Transcript written to {auto_path}", err=True)
+        else:
+            # Fallback: couldn't determine path (shouldn't happen since save
+            # succeeded, but be safe) — print to stdout.
+            click.echo(text)
+    else:
+        # Non-doc format or save is off — print to stdout as before.
+        click.echo(text)
+
+
+# ---------------------------------------------------------------------------
+# Subcommand: get-many — fetch several transcripts concurrently
+# ---------------------------------------------------------------------------
+
+def _emit_result(video: str, text: str, fmt: str, save: bool, db: str) -> None:
+    """
+    Write one get-many result the same way `get` would (minus --output).
+
+    doc format with save on goes to the auto-output path; everything else
+    is printed to stdout.
+    """
+    if fmt == "doc" and save:
+        from yt_transcript_extractor.extractor import parse_video_id
+
+        auto_path = _auto_output_path(parse_video_id(video), db)
+        if auto_path:
+            os.makedirs(os.path.dirname(auto_path), exist_ok=True)
+            # One write_text call instead of two buffered writes — fewer
+            # syscalls, which adds up for multi-MB doc outputs.
+            Path(auto_path).write_text(text + "\n", encoding="utf-8")
+            click.echo(f"Transcript written to {auto_path}", err=True)
+            return
+    click.echo(text)
+
+
+async def _get_many_async(
+    videos: tuple[str, ...],
+    languages: list[str] | None,
+    fmt: str,
+    pretty: bool | None,
+    save: bool,
+    db: str,
+    concurrency: int,
+) -> int:
+    """
+    Fetch all videos with at most `concurrency` extractions in flight.
+
+    Each extract() call runs in a worker thread (it's blocking network I/O),
+    so network waits overlap instead of running back-to-back.  Results are
+    emitted as they complete.  Returns the number of failed videos.
+    """
+    from yt_transcript_extractor.extractor import extract
+
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def fetch_one(video: str):
+        async with semaphore:
+            try:
+                result = await loop.run_in_executor(None, functools.partial(
+                    extract,
+                    video,
+                    languages=languages,
+                    fmt=fmt,
+                    save=save,
+                    db_path=db if save else None,
+                    metadata_cache=True,
+                ))
+                return video, result, None
+            except TranscriptError as exc:
+                return video, None, exc
+
+    failures = 0
+    for task in asyncio.as_completed([fetch_one(v) for v in videos]):
+        video, result, error = await task
+        if error is not None:
+            click.echo(f"Error ({video}): {error.message}", err=True)
+            failures += 1
+            continue
+
+        # JSON goes out as raw orjson bytes with the same pretty/compact
+        # pipe detection as `get` — it never takes the doc-only auto-path
+        # branch in _emit_result, so stdout is its only destination.
+        if isinstance(result, dict):
+            payload = orjson.dumps(result, option=_json_options(pretty, None))
+            click.get_binary_stream("stdout").write(payload)
+        else:
+            _emit_result(video, result, fmt, save, db)
+
+    return failures
+
+
+@click.command(name="get-many")
+@click.argument("videos", metavar="URLS_OR_IDS...", nargs=-1, required=True)
+@click.option(
+    "--format", "-f",
+    "fmt",
+    type=click.Choice(["text", "json", "doc"], case_sensitive=False),
+    default="doc",
+    show_default=True,
+    help="Output format: plain text, JSON with timestamps, or readable markdown document.",
+)
+@click.option(
+    "--lang", "-l",
+    default=None,
+    help="Comma-separated language codes in priority order (e.g. 'de,en'). Defaults to English.",
+)
+@click.option(
+    "--save/--no-save",
+    default=True,
+    show_default=True,
+    help="Save the transcripts to a local DuckDB database for offline access.",
+)
+@click.option(
+    "--pretty/--compact",
+    "pretty",
+    default=None,
+    help="Force pretty or compact JSON output. Default: pretty on a terminal, compact when piped.",
+)
+@click.option(
+    "--db",
+    default=_DEFAULT_DB,
+    show_default=True,
+    help="Path to the DuckDB database file (only used with --save).",
+)
+@click.option(
+    "--concurrency", "-c",
+    default=4,
+    show_default=True,
+    type=click.IntRange(1, 16),
+    help="Maximum number of videos fetched at the same time.",
+)
+def get_many(
+    videos: tuple[str, ...],
+    fmt: str,
+    lang: str | None,
+    save: bool,
+    pretty: bool | None,
+    db: str,
+    concurrency: int,
+) -> None:
+    """
+    Fetch transcripts for several videos in one invocation.
+
+    Each URL_OR_ID can be a full YouTube URL or an 11-character video ID.
+    Videos are fetched concurrently (bounded by --concurrency), so network
+    waits overlap instead of paying full startup + fetch cost per video as
+    a shell loop over `get` would.  Results are written as they complete;
+    the exit code is non-zero if any video failed.
+    """
+    from yt_transcript_extractor.extractor import parse_video_ids
+
+    languages: list[str] | None = None
+    if lang:
+        languages = [code.strip() for code in lang.split(",")]
+
+    # Parse every URL/ID up front: a malformed argument aborts the whole
+    # invocation before any network fetch, instead of surfacing as one
+    # failure among otherwise-wasted concurrent work.  The parsed IDs flow
+    # through to extract(), which skips re-parsing bare IDs.
+    try:
+        video_ids = tuple(parse_video_ids(videos))
+    except TranscriptError as exc:
+        click.echo(f"Error: {exc.message}", err=True)
+        sys.exit(1)
+
+    failures = asyncio.run(
+        _get_many_async(video_ids, languages, fmt, pretty, save, db, concurrency),
+    )
+    if failures:
+        click.echo(f"{failures} of {len(video_ids)} videos failed.", err=True)
+        sys.exit(1)
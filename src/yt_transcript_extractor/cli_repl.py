@@ -0,0 +1,74 @@
+"""
+cli_repl.py — the `repl` subcommand.
+
+An interactive shell for scripted/exploratory sessions.  Opening a DuckDB
+connection costs an mmap plus a catalog read; a loop like
+
+    for id in $ids; do yt-transcript saved "$id"; done
+
+pays that N times.  The repl opens one TranscriptStore and injects it into
+every dispatched subcommand via the Click context, so the whole session
+shares a single connection.
+"""
+
+from __future__ import annotations
+
+import shlex
+
+import click
+
+from yt_transcript_extractor.cli import _DEFAULT_DB, main as _root
+
+
+@click.command()
+@click.option(
+    "--db",
+    default=_DEFAULT_DB,
+    show_default=True,
+    help="Path to the DuckDB database file.",
+)
+def repl(db: str) -> None:
+    """
+    Run subcommands interactively over a single database connection.
+
+    Reads one command line at a time (e.g. `saved dQw4w9WgXcQ -f text`),
+    parses it shell-style, and dispatches to the normal subcommands.
+    Type `exit`, `quit`, or press Ctrl-D to leave.
+    """
+    from yt_transcript_extractor.storage import TranscriptStore
+
+    with TranscriptStore(db) as store:
+        while True:
+            try:
+                line = input("yt-transcript> ")
+            except EOFError:
+                break
+
+            try:
+                args = shlex.split(line)
+            except ValueError as exc:
+                # Unbalanced quotes etc. — report and keep the session alive.
+                click.echo(f"Error: {exc}", err=True)
+                continue
+            if not args:
+                continue
+            if args[0] in ("exit", "quit"):
+                break
+
+            try:
+                # standalone_mode=False keeps Click from calling sys.exit on
+                # usage errors; the injected store rides along in ctx.obj.
+                _root.main(
+                    args=args,
+                    prog_name="yt-transcript",
+                    standalone_mode=False,
+                    obj={"store": store},
+                )
+            except click.ClickException as exc:
+                exc.show()
+            except click.exceptions.Abort:
+                break
+            except SystemExit:
+                # Subcommands sys.exit(1) on their own errors — already
+                # reported to stderr, so just continue the session.
+                pass
@@ -0,0 +1,169 @@
+"""
+cli_saved.py — the `saved` subcommand.
+
+Loaded on demand by the LazyGroup in cli.py, so other invocations don't
+pay for the DuckDB import this command needs.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from pathlib import Path
+
+import click
+import orjson
+
+from yt_transcript_extractor.cli import (
+    _DEFAULT_DB,
+    _auto_output_path,
+    _json_options,
+    _open_store,
+)
+from yt_transcript_extractor.errors import TranscriptError
+
+
+# ---------------------------------------------------------------------------
+# Format renderers — each turns the fetched segment list into one output
+# format.  Dispatch goes through _FMT_DISPATCH below: O(1), no branch chain,
+# and adding a format is one function plus one table entry.
+# ---------------------------------------------------------------------------
+
+def _render_text(video_id: str, segments: list[dict], title_row) -> str:
+    """Plain text: one segment per line."""
+    return "\n".join(s["text"] for s in segments)
+
+
+def _render_json(video_id: str, segments: list[dict], title_row) -> dict:
+    """JSON payload matching the `get --format json` shape."""
+    return {
+        "video_id": video_id,
+        "segment_count": len(segments),
+        "segments": segments,
+    }
+
+
+def _render_doc(video_id: str, segments: list[dict], title_row) -> str:
+    """Readable HTML document via the extractor's shared formatter."""
+    # Same formatting path a fresh fetch uses; imported here so the
+    # text/json formats never load the extractor module.
+    from yt_transcript_extractor.extractor import format_doc
+
+    return format_doc(segments, title=title_row[0] if title_row else "Transcript")
+
+
+_FMT_DISPATCH = {
+    "text": _render_text,
+    "json": _render_json,
+    "doc": _render_doc,
+}
+
+
+@click.command()
+@click.argument("video_id")
+@click.option(
+    "--format", "-f",
+    "fmt",
+    type=click.Choice(["text", "json", "doc"], case_sensitive=False),
+    default="doc",
+    show_default=True,
+    help="Output format: plain text, JSON with timestamps, or readable markdown document.",
+)
+@click.option(
+    "--output", "-o",
+    type=click.Path(),
+    default=None,
+    help="Write output to a file instead of stdout.",
+)
+@click.option(
+    "--pretty/--compact",
+    "pretty",
+    default=None,
+    help="Force pretty or compact JSON output. Default: pretty on a terminal, compact when piped.",
+)
+@click.option(
+    "--db",
+    default=_DEFAULT_DB,
+    show_default=True,
+    help="Path to the DuckDB database file.",
+)
+@click.pass_context
+def saved(
+    ctx: click.Context,
+    video_id: str,
+    fmt: str,
+    output: str | None,
+    pretty: bool | None,
+    db: str,
+) -> None:
+    """
+    Retrieve a previously saved transcript from the local database.
+
+    VIDEO_ID is the 11-character YouTube video identifier.
+    This does NOT fetch from YouTube — it only reads from the local DB.
+    By default, writes a markdown document to
+    ~/Documents/yt-transcripts/{channel}/{title}.html.
+    """
+    try:
+        with _open_store(ctx, db) as store:
+            if not store.has_video(video_id):
+                click.echo(
+                    f"Error: Video {video_id} not found in database. "
+                    f"Use 'yt-transcript get {video_id}' to save it first.",
+                    err=True,
+                )
+                sys.exit(1)
+
+            # Fetch the segments once — every output format is a cheap
+            # in-process transform of the same list, so the DB is touched
+            # at most twice (segments + title for doc) regardless of format.
+            segments = store.get_transcript(video_id)
+            title_row = (
+                store.get_video_title_and_channel(video_id) if fmt == "doc" else None
+            )
+    except TranscriptError as exc:
+        click.echo(f"Error: {exc.message}", err=True)
+        sys.exit(1)
+
+    # click.Choice(case_sensitive=False) already normalized fmt to the
+    # lowercase declared value, so the table lookup is safe as-is.
+    result: str | dict = _FMT_DISPATCH[fmt](video_id, segments, title_row)
+
+    # JSON output goes out as the raw orjson bytes — decoding to str and
+    # re-encoding on write would double peak memory for transcripts with
+    # thousands of segments.  JSON never takes the auto-path branch (that's
+    # doc-only), so only the file and stdout destinations matter here.
+    if isinstance(result, dict):
+        payload = orjson.dumps(result, option=_json_options(pretty, output))
+        if output:
+            Path(output).write_bytes(payload)
+            click.echo(f"Transcript written to {output}", err=True)
+        else:
+            click.get_binary_stream("stdout").write(payload)
+        return
+
+    text = result
+
+    # Write to file or stdout.
+    if output:
+        # Explicit --output given — write to that exact path.
+        Path(output).write_text(text + "\n", encoding="utf-8")
+        click.echo(f"Transcript written to {output}", err=True)
+    elif fmt == "doc":
+        # Auto-path mode: doc format + no explicit --output.
+        # Build the path from DB metadata and write the file there.
+        auto_path = _auto_output_path(video_id, db)
+
+        if auto_path:
+            os.makedirs(os.path.dirname(auto_path), exist_ok=True)
+            # One write_text call instead of two buffered writes — fewer
+            # syscalls, which adds up for multi-MB doc outputs.
+            Path(auto_path).write_text(text + "\n", encoding="utf-8")
+            click.echo(f"Transcript written to {auto_path}", err=True)
+        else:
+            # Fallback: couldn't determine path — print to stdout.
+            click.echo(text)
+    else:
+        # Non-doc format — print to stdout as before.
+        click.echo(text)
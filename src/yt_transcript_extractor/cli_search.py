@@ -0,0 +1,65 @@
+"""
+cli_search.py — the `search` subcommand.
+
+Loaded on demand by the LazyGroup in cli.py, so other invocations don't
+pay for the DuckDB import this command needs.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+from yt_transcript_extractor.cli import _DEFAULT_DB, _open_store
+from yt_transcript_extractor.errors import TranscriptError
+
+
+@click.command()
+@click.argument("query")
+@click.option(
+    "--db",
+    default=_DEFAULT_DB,
+    show_default=True,
+    help="Path to the DuckDB database file.",
+)
+@click.pass_context
+def search(ctx: click.Context, query: str, db: str) -> None:
+    """
+    Search across all saved transcripts for a keyword or phrase.
+
+    QUERY is a case-insensitive substring to search for in transcript text.
+    Results show matching segments with their video context and timestamps.
+    """
+    try:
+        with _open_store(ctx, db) as store:
+            results = store.search_transcripts(query)
+    except TranscriptError as exc:
+        click.echo(f"Error: {exc.message}", err=True)
+        sys.exit(1)
+
+    if not results:
+        click.echo(f"No results found for '{query}'.")
+        return
+
+    # Group results by video for readable output.  Lines are accumulated
+    # and flushed in one write at the end — three click.echo calls per
+    # segment means thousands of small write() syscalls on big result
+    # sets, which throttles piping into less/grep.
+    buf: list[str] = []
+    append = buf.append
+    # Pre-bound formatter for the MM:SS result lines — one bound-method
+    # call per row instead of rebuilding f-string padding logic, which
+    # adds up over thousands of matches.
+    fmt_line = "  [{:02d}:{:02d}] {}\n".format
+    current_video = None
+    for r in results:
+        # Start a header block when we move to a new video.
+        if r["video_id"] != current_video:
+            current_video = r["video_id"]
+            append(f"\n{r['title']} ({r['channel_name']})\n  Video ID: {current_video}\n")
+
+        minutes, seconds = divmod(int(r["start"]), 60)
+        append(fmt_line(minutes, seconds, r["text"]))
+
+    click.echo("".join(buf), nl=False)
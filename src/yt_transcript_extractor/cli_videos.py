@@ -0,0 +1,50 @@
+"""
+cli_videos.py — the `videos` subcommand.
+
+Loaded on demand by the LazyGroup in cli.py, so other invocations don't
+pay for the DuckDB import this command needs.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+from yt_transcript_extractor.cli import _DEFAULT_DB, _open_store
+from yt_transcript_extractor.errors import TranscriptError
+
+
+@click.command()
+@click.argument("channel_id")
+@click.option(
+    "--db",
+    default=_DEFAULT_DB,
+    show_default=True,
+    help="Path to the DuckDB database file.",
+)
+@click.pass_context
+def videos(ctx: click.Context, channel_id: str, db: str) -> None:
+    """
+    List all saved videos for a specific channel.
+
+    CHANNEL_ID is the YouTube channel identifier (e.g. UC38IQsAvIsxxjztdMZQtwHA).
+    Use 'yt-transcript channels' to find channel IDs.
+    """
+    try:
+        with _open_store(ctx, db) as store:
+            video_list = store.list_videos(channel_id)
+    except TranscriptError as exc:
+        click.echo(f"Error: {exc.message}", err=True)
+        sys.exit(1)
+
+    if not video_list:
+        click.echo(f"No saved videos found for channel {channel_id}.")
+        return
+
+    # Display each video with its title, ID, and upload date.
+    for v in video_list:
+        date_str = str(v.upload_date) if v.upload_date else "unknown date"
+        click.echo(f"[{date_str}] {v.title}")
+        click.echo(f"  ID: {v.video_id}")
+        click.echo()
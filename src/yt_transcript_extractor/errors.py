@@ -5,6 +5,12 @@ Every exception carries an `http_status` attribute so the FastAPI error
 handler can translate library-level errors directly into the correct HTTP
 response code without a separate mapping table.
 
+Messages are rendered lazily: subclasses store their raw context (video ID,
+requested languages) and build the human-readable string only when
+`.message` or `str(exc)` is accessed.  Batch operations over many bad IDs
+construct these exceptions in a loop, and most are caught and counted
+without their message ever being read.
+
 Hierarchy:
     TranscriptError (base, 500)
     ├── VideoNotFoundError (404)
@@ -24,16 +30,38 @@ class TranscriptError(Exception):
     Root exception for all transcript-related errors.
 
     Attributes:
-        message:     Human-readable description of what went wrong.
-        http_status: Suggested HTTP status code for the API layer.
+        message:     Human-readable description of what went wrong
+                     (a lazily-rendered property, not an instance attribute).
+        http_status: Suggested HTTP status code for the API layer.  A class
+                     attribute — the status never varies within a subclass,
+                     so storing it per instance would just waste a slot.
     """
 
-    def __init__(self, message: str, http_status: int = 500) -> None:
-        super().__init__(message)
-        self.message = message
-        # Why store status on the exception?  It lets the FastAPI error handler
-        # use a single generic handler instead of one handler per exception type.
-        self.http_status = http_status
+    # __slots__ keeps construction cheap on the hot error path.  BaseException
+    # doesn't declare slots itself, so instances still get a __dict__ — but it
+    # stays empty, and attribute access goes through the faster slot path.
+    __slots__ = ()
+
+    # Why store status on the exception class?  It lets the FastAPI error
+    # handler use a single generic handler instead of one per exception type.
+    http_status = 500
+
+    def __init__(self, message: str | None = None) -> None:
+        # The message (when given eagerly) lives in the C-level args tuple
+        # that Exception already maintains — no duplicate instance attribute.
+        super().__init__(*(() if message is None else (message,)))
+
+    def _render_message(self) -> str:
+        """Build the human-readable message (subclasses override)."""
+        return self.args[0] if self.args else ""
+
+    @property
+    def message(self) -> str:
+        """Human-readable description of what went wrong."""
+        return self._render_message()
+
+    def __str__(self) -> str:
+        return self._render_message()
 
 
 # ---------------------------------------------------------------------------
@@ -48,13 +76,17 @@ class VideoNotFoundError(TranscriptError):
     Maps to HTTP 404.
     """
 
+    __slots__ = ("video_id",)
+
+    http_status = 404
+
     def __init__(self, video_id: str) -> None:
-        super().__init__(
-            message=f"Video not found: {video_id}",
-            http_status=404,
-        )
+        super().__init__()
         self.video_id = video_id
 
+    def _render_message(self) -> str:
+        return f"Video not found: {self.video_id}"
+
 
 class TranscriptUnavailableError(TranscriptError):
     """
@@ -65,13 +97,17 @@ class TranscriptUnavailableError(TranscriptError):
     Maps to HTTP 404.
     """
 
+    __slots__ = ("video_id",)
+
+    http_status = 404
+
     def __init__(self, video_id: str) -> None:
-        super().__init__(
-            message=f"No transcript available for video: {video_id}",
-            http_status=404,
-        )
+        super().__init__()
         self.video_id = video_id
 
+    def _render_message(self) -> str:
+        return f"No transcript available for video: {self.video_id}"
+
 
 class LanguageNotAvailableError(TranscriptError):
     """
@@ -82,15 +118,20 @@ class LanguageNotAvailableError(TranscriptError):
     request issue — the resource exists, just not in that language.
     """
 
+    __slots__ = ("video_id", "requested")
+
+    http_status = 400
+
     def __init__(self, video_id: str, requested: list[str]) -> None:
-        langs = ", ".join(requested)
-        super().__init__(
-            message=f"Transcript not available in language(s) [{langs}] for video: {video_id}",
-            http_status=400,
-        )
+        super().__init__()
         self.video_id = video_id
         self.requested = requested
 
+    def _render_message(self) -> str:
+        # The ", ".join only happens here, when the message is actually read.
+        langs = ", ".join(self.requested)
+        return f"Transcript not available in language(s) [{langs}] for video: {self.video_id}"
+
 
 class MetadataFetchError(TranscriptError):
     """
@@ -101,13 +142,18 @@ class MetadataFetchError(TranscriptError):
     our server is healthy but the third-party source returned an error.
     """
 
+    __slots__ = ("video_id", "reason")
+
+    http_status = 502
+
     def __init__(self, video_id: str, reason: str = "") -> None:
-        detail = f": {reason}" if reason else ""
-        super().__init__(
-            message=f"Failed to fetch metadata for video {video_id}{detail}",
-            http_status=502,
-        )
+        super().__init__()
         self.video_id = video_id
+        self.reason = reason
+
+    def _render_message(self) -> str:
+        detail = f": {self.reason}" if self.reason else ""
+        return f"Failed to fetch metadata for video {self.video_id}{detail}"
 
 
 class StorageError(TranscriptError):
@@ -119,8 +165,7 @@ class StorageError(TranscriptError):
     server issue — the caller's request was valid but our storage layer broke.
     """
 
+    __slots__ = ()
+
     def __init__(self, message: str) -> None:
-        super().__init__(
-            message=message,
-            http_status=500,
-        )
+        super().__init__(message)
@@ -14,12 +14,18 @@ Only single-video extraction is supported (no playlists).
 
 from __future__ import annotations
 
+import io
 import json
 import re
+import threading
 
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._transcripts import FetchedTranscript
-import youtube_transcript_api as yta_errors  # exception classes live here
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from youtube_transcript_api._transcripts import FetchedTranscript
 
 from yt_transcript_extractor.errors import (
     LanguageNotAvailableError,
@@ -32,24 +38,34 @@ from yt_transcript_extractor.errors import (
 # Constants
 # ---------------------------------------------------------------------------
 
-# Regex patterns that cover the most common YouTube URL shapes:
+# One regex covering the common YouTube URL shapes:
 #   - https://www.youtube.com/watch?v=VIDEO_ID
 #   - https://youtu.be/VIDEO_ID
 #   - https://www.youtube.com/embed/VIDEO_ID
 #   - https://www.youtube.com/shorts/VIDEO_ID
 #   - https://www.youtube.com/v/VIDEO_ID
-# Each pattern captures the 11-character video ID in group "id".
-_URL_PATTERNS: list[re.Pattern[str]] = [
-    # Standard watch URL — the ID sits in the "v" query parameter
-    re.compile(r"(?:https?://)?(?:www\.)?youtube\.com/watch\?.*v=(?P<id>[A-Za-z0-9_-]{11})"),
-    # Short share URL — ID is the path segment right after the domain
-    re.compile(r"(?:https?://)?youtu\.be/(?P<id>[A-Za-z0-9_-]{11})"),
-    # Embed / shorts / old "v/" URLs — ID follows the path prefix
-    re.compile(r"(?:https?://)?(?:www\.)?youtube\.com/(?:embed|shorts|v)/(?P<id>[A-Za-z0-9_-]{11})"),
-]
+#   - https://www.youtube-nocookie.com/embed/VIDEO_ID  (privacy-enhanced embeds)
+#   - https://www.youtube.com/attribution_link?...u=/watch?v=VIDEO_ID
+# The shapes used to live in a list of three patterns tried in a loop; a
+# single alternation lets the regex engine scan the input once instead of
+# up to three times.  The 11-character video ID lands in group "id".
+_URL_PATTERN: re.Pattern[str] = re.compile(
+    r"(?:https?://)?(?:www\.)?"
+    r"(?:youtube(?:-nocookie)?\.com/(?:watch\?.*v=|embed/|shorts/|v/|attribution_link\?.*u=/watch\?v=)"
+    r"|youtu\.be/)"
+    r"(?P<id>[A-Za-z0-9_-]{11})",
+    # The character classes are pure ASCII; re.ASCII lets the engine skip
+    # Unicode-aware classification on every character test.
+    re.ASCII,
+)
 
 # A bare video ID is exactly 11 characters from the base64url alphabet.
-_BARE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{11}$")
+_BARE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{11}$", re.ASCII)
+
+# Alphabet for the bare-ID fast path in parse_video_id: a frozenset makes the
+# subset check a handful of C-level hash lookups, cheaper than entering the
+# regex engine for the overwhelmingly common bare-ID input.
+_ID_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-")
 
 # Default language fallback order: English first, then auto-generated.
 # youtube-transcript-api tries languages in order and falls back automatically,
@@ -61,6 +77,18 @@ _DEFAULT_LANGUAGES = ["en"]
 # URL / ID parsing
 # ---------------------------------------------------------------------------
 
+class VideoID(str):
+    """
+    An already-validated 11-character YouTube video ID.
+
+    Batch callers can run parse_video_id() once, wrap the result, and pass
+    it to extract() repeatedly — extract() skips re-parsing for this type.
+    A plain str subclass, so it works anywhere a video ID string does.
+    """
+
+    __slots__ = ()
+
+@lru_cache(maxsize=1024)
 def parse_video_id(url_or_id: str) -> str:
     """
     Extract a YouTube video ID from a URL string, or validate a raw 11-char ID.
@@ -68,6 +96,9 @@ def parse_video_id(url_or_id: str) -> str:
     Accepts all common YouTube URL formats (watch, short, embed, shorts) as
     well as a bare 11-character ID string.
 
+    Pure and memoized: repeat parses of the same URL (batch scripts, the
+    API re-validating IDs per request) return straight from the cache.
+
     Args:
         url_or_id: A YouTube URL or a raw video ID.
 
@@ -79,11 +110,20 @@ def parse_video_id(url_or_id: str) -> str:
     """
     url_or_id = url_or_id.strip()
 
-    # Try each URL pattern first — order doesn't matter since they're disjoint.
-    for pattern in _URL_PATTERNS:
-        match = pattern.search(url_or_id)
-        if match:
-            return match.group("id")
+    # Fast path: a bare 11-character ID needs no regex at all.  The prefix
+    # check rules out the (pathological) URL that happens to be 11 chars,
+    # and the set comparison validates the base64url alphabet in C.
+    if (
+        len(url_or_id) == 11
+        and not url_or_id.startswith(("http", "youtu", "www."))
+        and set(url_or_id) <= _ID_CHARS
+    ):
+        return url_or_id
+
+    # Try the URL shapes first — one search over the combined alternation.
+    match = _URL_PATTERN.search(url_or_id)
+    if match:
+        return match.group("id")
 
     # Fall back to treating the input as a bare ID.
     if _BARE_ID_PATTERN.match(url_or_id):
@@ -93,10 +133,135 @@ def parse_video_id(url_or_id: str) -> str:
     raise VideoNotFoundError(url_or_id)
 
 
+def parse_video_ids(texts: Iterable[str]) -> Iterator[str]:
+    """
+    Parse many YouTube URLs/IDs in one streaming pass.
+
+    Equivalent to mapping parse_video_id() over the input, but built for
+    bulk callers (CSV imports, get-many): the pattern methods are bound
+    once outside the loop instead of being re-resolved per item, and IDs
+    are yielded lazily so arbitrarily large inputs stream through without
+    being materialized.
+
+    Args:
+        texts: An iterable of YouTube URLs and/or raw video IDs.
+
+    Yields:
+        The 11-character video ID for each input, in order.
+
+    Raises:
+        VideoNotFoundError: On the first input that doesn't match any
+                            known format (parsing stops there).
+    """
+    search = _URL_PATTERN.search
+    bare_match = _BARE_ID_PATTERN.match
+    id_chars = _ID_CHARS
+
+    for text in texts:
+        text = text.strip()
+
+        # Same fast path / URL / bare-ID cascade as parse_video_id.
+        if (
+            len(text) == 11
+            and not text.startswith(("http", "youtu", "www."))
+            and set(text) <= id_chars
+        ):
+            yield text
+            continue
+
+        match = search(text)
+        if match:
+            yield match.group("id")
+            continue
+
+        if bare_match(text):
+            yield text
+            continue
+
+        raise VideoNotFoundError(text)
+
+
 # ---------------------------------------------------------------------------
 # Transcript fetching
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
+def _get_api():
+    """
+    Return the shared YouTubeTranscriptApi client, creating it on first use.
+
+    The constructor builds an HTTP session; sharing one instance across
+    calls keeps that session's connection pool alive, so fetches after the
+    first reuse the TCP+TLS connection instead of handshaking again.
+
+    The import lives here too: youtube-transcript-api drags in requests
+    and defusedxml, which callers that only parse or format (no network)
+    should never pay for at import time.
+    """
+    from youtube_transcript_api import YouTubeTranscriptApi
+
+    return YouTubeTranscriptApi()
+
+
+def _reset_api() -> None:
+    """Drop the shared API client (used by tests to force a fresh session)."""
+    _get_api.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _exc_map() -> dict:
+    """
+    Build the upstream-exception → builder dispatch map on first use.
+
+    One dict lookup on the error path replaces a chain of sibling except
+    clauses; the happy path carries a single except block.
+    CouldNotRetrieveTranscript is the upstream base class, so walking an
+    exception's MRO always terminates at its catch-all entry.  Built
+    lazily because the upstream module itself is imported on demand.
+    """
+    import youtube_transcript_api as yta_errors  # exception classes live here
+
+    return {
+        yta_errors.InvalidVideoId: lambda vid, langs, exc: VideoNotFoundError(vid),
+        yta_errors.VideoUnavailable: lambda vid, langs, exc: VideoNotFoundError(vid),
+        yta_errors.TranscriptsDisabled: lambda vid, langs, exc: TranscriptUnavailableError(vid),
+        # Transcripts exist, but not in the requested language.
+        yta_errors.NoTranscriptFound: lambda vid, langs, exc: LanguageNotAvailableError(vid, langs),
+        # Generic upstream error — wrap it so callers only need to catch our
+        # TranscriptError hierarchy.
+        yta_errors.CouldNotRetrieveTranscript: lambda vid, langs, exc: TranscriptError(str(exc)),
+    }
+
+
+@lru_cache(maxsize=128)
+def _get_transcript_cached(video_id: str, langs: tuple[str, ...]) -> FetchedTranscript:
+    """
+    Fetch and cache a transcript, keyed on (video_id, language tuple).
+
+    Transcripts for a published video are effectively immutable, so a
+    long-running process (the API server, the repl) can serve repeated
+    requests for the same video from memory instead of re-downloading.
+    Failed fetches raise and are not cached — lru_cache only stores
+    successful returns, so transient errors get retried.
+    """
+    import youtube_transcript_api as yta_errors  # exception classes live here
+
+    try:
+        transcript = _get_api().fetch(video_id, languages=list(langs))
+        return transcript
+
+    # --- Map upstream exceptions to our own hierarchy (see _exc_map) ---
+    except yta_errors.CouldNotRetrieveTranscript as exc:
+        # Walk the MRO so subclasses not listed explicitly still map the
+        # same way the old sibling except-chain would have caught them.
+        exc_map = _exc_map()
+        for klass in type(exc).__mro__:
+            build = exc_map.get(klass)
+            if build is not None:
+                raise build(video_id, list(langs), exc) from exc
+        raise  # unreachable: CouldNotRetrieveTranscript is in the map
+
+
 def get_transcript(
     video_id: str,
     languages: list[str] | None = None,
@@ -108,6 +273,10 @@ def get_transcript(
     if specific languages are requested, try those first; otherwise fall back
     to English → auto-generated.
 
+    Successful fetches are cached in-process (see _get_transcript_cached),
+    so repeated calls for the same video and languages hit memory.  Call
+    ``get_transcript.cache_clear()`` to drop the cache.
+
     Args:
         video_id:  The 11-character YouTube video ID (NOT a full URL).
         languages: Optional list of language codes in descending priority
@@ -124,27 +293,13 @@ def get_transcript(
                                      requested language(s).
         TranscriptError:             Catch-all for unexpected upstream errors.
     """
-    langs = languages if languages else _DEFAULT_LANGUAGES
+    # Normalize to a hashable tuple so the languages list can key the cache.
+    langs = tuple(languages) if languages else tuple(_DEFAULT_LANGUAGES)
+    return _get_transcript_cached(video_id, langs)
 
-    try:
-        api = YouTubeTranscriptApi()
-        transcript = api.fetch(video_id, languages=langs)
-        return transcript
 
-    # --- Map upstream exceptions to our own hierarchy ---
-    except yta_errors.InvalidVideoId:
-        raise VideoNotFoundError(video_id)
-    except yta_errors.VideoUnavailable:
-        raise VideoNotFoundError(video_id)
-    except yta_errors.TranscriptsDisabled:
-        raise TranscriptUnavailableError(video_id)
-    except yta_errors.NoTranscriptFound:
-        # Transcripts exist, but not in the requested language.
-        raise LanguageNotAvailableError(video_id, langs)
-    except yta_errors.CouldNotRetrieveTranscript as exc:
-        # Generic upstream error — wrap it so callers only need to catch
-        # our TranscriptError hierarchy.
-        raise TranscriptError(str(exc)) from exc
+# Re-exported so callers can invalidate without reaching for the private name.
+get_transcript.cache_clear = _get_transcript_cached.cache_clear  # type: ignore[attr-defined]
 
 
 # ---------------------------------------------------------------------------
@@ -164,7 +319,9 @@ def format_text(transcript: FetchedTranscript) -> str:
     Returns:
         A single string with one transcript line per text line.
     """
-    return "\n".join(snippet.text for snippet in transcript)
+    # map + attrgetter keeps the per-snippet work in C — no generator
+    # frame resumption per line, which shows up on hour-long transcripts.
+    return "\n".join(map(attrgetter("text"), transcript))
 
 
 def format_json(transcript: FetchedTranscript, video_id: str) -> dict:
@@ -182,7 +339,13 @@ def format_json(transcript: FetchedTranscript, video_id: str) -> dict:
         A dict with keys: video_id, segment_count, segments.
         Each segment has: text, start, duration.
     """
-    segments = transcript.to_raw_data()
+    # Same dicts to_raw_data() would build, but constructed directly in
+    # one comprehension — skipping that call's extra function layer and
+    # letting the attribute access inline into the loop.
+    segments = [
+        {"text": s.text, "start": s.start, "duration": s.duration}
+        for s in transcript
+    ]
     return {
         "video_id": video_id,
         "segment_count": len(segments),
@@ -196,6 +359,14 @@ def format_json(transcript: FetchedTranscript, video_id: str) -> dict:
 _DOC_PARAGRAPH_INTERVAL_SECS = 30
 
 
+@lru_cache(maxsize=512)
+def _mmss_int(total: int) -> str:
+    """Format whole seconds as MM:SS, memoized per distinct value."""
+    # %-formatting takes one C call for both zero-padded fields; only the
+    # cache-miss path pays it at all.
+    return "%02d:%02d" % divmod(total, 60)
+
+
 def _seconds_to_mmss(seconds: float) -> str:
     """
     Convert a float timestamp (in seconds) to a MM:SS string.
@@ -203,59 +374,41 @@ def _seconds_to_mmss(seconds: float) -> str:
     Used by format_doc() to produce human-readable time markers.
     Values above 59:59 wrap naturally (e.g. 3661.0 → "61:01").
 
+    Paragraph boundary times repeat heavily across transcripts (most fall
+    on the same small whole-second values), so the formatting is memoized
+    on the truncated integer — repeated calls in a long-running process
+    reuse the built string instead of redoing divmod and f-string work.
+
     Args:
         seconds: Timestamp in seconds (e.g. 92.5).
 
     Returns:
         A string like "01:32".
     """
-    total = int(seconds)
-    mins, secs = divmod(total, 60)
-    return f"{mins:02d}:{secs:02d}"
-
-
-def _format_details_block(timestamp: str, body: str) -> str:
-    """
-    Wrap a transcript paragraph in a styled <details>/<summary> block.
-
-    Each time-windowed chunk of text becomes a collapsible panel that
-    looks like an Ant Design Collapse.Panel.  The summary bar shows the
-    timestamp as a pill badge followed by the first 50 characters of the
-    segment text with an ellipsis, giving a preview of the content.
-
-    Args:
-        timestamp: A MM:SS string (e.g. "01:32") shown in the summary bar.
-        body:      The transcript text for this time window.
-
-    Returns:
-        An HTML string with <details>, <summary> (containing a .timestamp
-        span and a .preview span), and a .panel-content div for the body.
-    """
-    # Show the first 75 characters as a preview in the title bar.
-    preview = body[:75] + "..." if len(body) > 75 else body
-    return (
-        f"<details>\n"
-        f"<summary><span class=\"timestamp\">{timestamp}</span> {preview}</summary>\n"
-        f"<div class=\"panel-content\">{body}</div>\n"
-        f"</details>"
-    )
+    return _mmss_int(int(seconds))
 
 
 # HTML wrapper for the doc format, styled to look like Ant Design's Collapse
 # component.  Uses antd's design tokens (colors, radii, shadows, typography)
 # so the file looks polished when opened directly in a browser — no React or
-# JS required.  The {{...}} escapes are needed because this is a Python
-# format-string template (str.format fills {title} and {body}).
-_HTML_TEMPLATE = """\
+# JS required.  The wrapper is stored pre-split around the title and body
+# slots so format_doc can join plain strings — str.format would rescan all
+# ~4 KB of CSS for placeholders on every call (and forced {{...}} escapes
+# on every brace in the stylesheet).  The pieces, in document order:
+_HTML_PRE = """\
 <!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width, initial-scale=1">
-<title>{title}</title>
+<title>"""
+
+# ...between the <title> and <h1> slots (both get the same title text)...
+_HTML_MID = """\
+</title>
 <style>
   /* --- antd design tokens (v5) --- */
-  :root {{
+  :root {
     --ant-color-bg-container: #ffffff;
     --ant-color-bg-layout: #f0f2f5;
     --ant-color-bg-elevated: #fafafa;
@@ -272,13 +425,13 @@ _HTML_TEMPLATE = """\
     --ant-padding-lg: 24px;
     --ant-padding-md: 16px;
     --ant-padding-sm: 12px;
-  }}
+  }
 
   /* --- reset & page layout --- */
-  *, *::before, *::after {{ box-sizing: border-box; }}
+  *, *::before, *::after { box-sizing: border-box; }
 
   /* Warm gradient background instead of flat gray; antialiased text. */
-  body {{
+  body {
     font-family: var(--ant-font-family);
     font-size: var(--ant-font-size);
     line-height: var(--ant-line-height);
@@ -289,21 +442,21 @@ _HTML_TEMPLATE = """\
     padding: var(--ant-padding-lg);
     -webkit-font-smoothing: antialiased;
     -moz-osx-font-smoothing: grayscale;
-  }}
+  }
 
   /* White card that floats on the gradient background. */
-  .container {{
+  .container {
     max-width: 800px;
     margin: 0 auto;
     background: var(--ant-color-bg-container);
     border-radius: var(--ant-border-radius);
     box-shadow: 0 2px 8px rgba(0, 0, 0, 0.06), 0 1px 2px rgba(0, 0, 0, 0.04);
     padding: var(--ant-padding-lg);
-  }}
+  }
 
   /* --- page title — antd Typography h1 style --- */
   /* Slightly smaller than before (34px) with a thin accent underline. */
-  h1 {{
+  h1 {
     font-weight: 600;
     font-size: 34px;
     line-height: 1.2;
@@ -311,30 +464,30 @@ _HTML_TEMPLATE = """\
     padding-bottom: var(--ant-padding-sm);
     border-bottom: 2px solid var(--ant-color-primary);
     color: var(--ant-color-text);
-  }}
+  }
 
   /* --- collapse wrapper — antd Collapse container --- */
   /* Soft shadow instead of a hard border — panels feel lighter. */
-  .collapse {{
+  .collapse {
     background: var(--ant-color-bg-elevated);
     border: none;
     border-radius: var(--ant-border-radius);
     box-shadow: 0 1px 4px rgba(0, 0, 0, 0.06);
     overflow: hidden;
-  }}
+  }
 
   /* --- each panel — antd Collapse.Panel --- */
-  details {{
+  details {
     border-bottom: 1px solid var(--ant-color-border);
-  }}
+  }
 
-  details:last-child {{
+  details:last-child {
     border-bottom: none;
-  }}
+  }
 
   /* --- panel header — antd Collapse.Panel header --- */
   /* Ellipsis on long previews; subtle gradient on hover; more padding. */
-  summary {{
+  summary {
     display: flex;
     align-items: center;
     gap: 8px;
@@ -352,23 +505,23 @@ _HTML_TEMPLATE = """\
     overflow: hidden;
     text-overflow: ellipsis;
     transition: background 0.25s ease;
-  }}
+  }
 
-  summary:hover {{
+  summary:hover {
     background: linear-gradient(90deg, var(--ant-color-bg-container) 0%, var(--ant-color-bg-elevated) 100%);
-  }}
+  }
 
   /* Light blue tint on the expanded panel's summary bar. */
-  details[open] > summary {{
+  details[open] > summary {
     background: rgba(22, 119, 255, 0.04);
-  }}
+  }
 
   /* Remove the default browser disclosure triangle. */
-  summary::-webkit-details-marker {{ display: none; }}
-  summary::marker {{ display: none; content: ""; }}
+  summary::-webkit-details-marker { display: none; }
+  summary::marker { display: none; content: ""; }
 
   /* Custom caret — inline SVG chevron for crisp rendering at all sizes. */
-  summary::before {{
+  summary::before {
     content: "";
     display: inline-block;
     width: 12px;
@@ -376,14 +529,14 @@ _HTML_TEMPLATE = """\
     background: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 16 16'%3E%3Cpath d='M6 3l5 5-5 5' fill='none' stroke='rgba(0,0,0,0.45)' stroke-width='1.5' stroke-linecap='round' stroke-linejoin='round'/%3E%3C/svg%3E") center / contain no-repeat;
     flex-shrink: 0;
     transition: transform 0.25s ease;
-  }}
+  }
 
-  details[open] > summary::before {{
+  details[open] > summary::before {
     transform: rotate(90deg);
-  }}
+  }
 
   /* Timestamp pill — more saturated, with a thin border and shadow. */
-  summary .timestamp {{
+  summary .timestamp {
     font-family: 'SF Mono', 'Cascadia Code', 'Consolas', monospace;
     font-size: 12px;
     font-weight: 500;
@@ -394,11 +547,11 @@ _HTML_TEMPLATE = """\
     padding: 2px 8px;
     border-radius: 4px;
     flex-shrink: 0;
-  }}
+  }
 
   /* --- panel body — antd Collapse.Panel content area --- */
   /* Thin left accent border replaces the deep indent; roomier line-height. */
-  .panel-content {{
+  .panel-content {
     padding: var(--ant-padding-md) var(--ant-padding-md) var(--ant-padding-md) var(--ant-padding-md);
     margin-left: var(--ant-padding-md);
     border-left: 2px solid var(--ant-color-primary);
@@ -406,27 +559,47 @@ _HTML_TEMPLATE = """\
     line-height: 1.9;
     background: var(--ant-color-bg-container);
     animation: fadeIn 0.15s ease;
-  }}
+  }
 
   /* Subtle fade-in when a panel opens. */
-  @keyframes fadeIn {{
-    from {{ opacity: 0; transform: translateY(-4px); }}
-    to   {{ opacity: 1; transform: translateY(0); }}
-  }}
+  @keyframes fadeIn {
+    from { opacity: 0; transform: translateY(-4px); }
+    to   { opacity: 1; transform: translateY(0); }
+  }
 </style>
 </head>
 <body>
 <div class="container">
-<h1>{title}</h1>
+<h1>"""
+
+# ...between the <h1> and the collapsible body...
+_HTML_SEP = """\
+</h1>
 <div class="collapse">
-{body}
+"""
+
+# Fixed markup fragments for one collapsible <details> panel, written
+# around the per-paragraph timestamp, preview, and body text.
+_PANEL_OPEN = "<details>\n<summary><span class=\"timestamp\">"
+_PANEL_AFTER_TS = "</span> "
+_PANEL_AFTER_PREVIEW = "</summary>\n<div class=\"panel-content\">"
+_PANEL_CLOSE = "</div>\n</details>"
+
+# ...and everything after the body.
+_HTML_POST = """\
+
 </div>
 </div>
 </body>
 </html>"""
 
 
-def format_doc(transcript, title: str = "Transcript") -> str:
+def format_doc(
+    transcript,
+    title: str = "Transcript",
+    *,
+    full_document: bool = True,
+) -> str:
     """
     Convert transcript segments into an HTML document with collapsible sections.
 
@@ -435,8 +608,11 @@ def format_doc(transcript, title: str = "Transcript") -> str:
     a collapsible <details>/<summary> block, with the MM:SS timestamp
     as the summary header.
 
-    The output is a complete HTML document (with <!DOCTYPE>, <head>, and
-    minimal CSS) so it renders nicely when opened directly in a browser.
+    By default the output is a complete HTML document (with <!DOCTYPE>,
+    <head>, and minimal CSS) so it renders nicely when opened directly in
+    a browser.  Callers embedding many transcripts in one page can pass
+    ``full_document=False`` to get just the collapsible panels and pay
+    for the ~5 KB document wrapper once instead of per transcript.
 
     The transcript argument can be either a FetchedTranscript (iterable of
     snippet objects with .text and .start attrs) or a list of dicts with
@@ -444,67 +620,150 @@ def format_doc(transcript, title: str = "Transcript") -> str:
     stored-segment code paths.
 
     Args:
-        transcript: A FetchedTranscript or list of {"text", "start", ...} dicts.
-        title:      Document title shown in the browser tab and as an <h1>.
-                    Defaults to "Transcript".
+        transcript:    A FetchedTranscript or list of {"text", "start", ...} dicts.
+        title:         Document title shown in the browser tab and as an <h1>.
+                       Defaults to "Transcript".  Ignored when
+                       full_document is False.
+        full_document: When False, emit only the <details> panels without
+                       the surrounding HTML document.  Defaults to True.
 
     Returns:
-        A complete HTML string with collapsible timestamped sections.
+        A complete HTML string with collapsible timestamped sections (or
+        just the sections when full_document is False).
         Returns an empty string if the transcript has no segments.
     """
-    sections: list[str] = []
-    current_texts: list[str] = []
-    # Track which 30-second bucket the current paragraph belongs to.
-    # None means we haven't started yet.
-    paragraph_start: float | None = None
-
-    for snippet in transcript:
-        # Support both FetchedTranscript snippet objects (.start, .text)
-        # and plain dicts from stored segments ({"start": ..., "text": ...}).
-        if isinstance(snippet, dict):
-            start = snippet["start"]
-            text = snippet["text"]
+    # Peek at the first element without materializing the input — for a
+    # list (or list-backed FetchedTranscript) this avoids a full copy, and
+    # the scan below consumes the rest of the iterator directly.
+    iterator = iter(transcript)
+    first = next(iterator, None)
+    if first is None:
+        return ""
+
+    # Support both FetchedTranscript snippet objects (.start, .text) and
+    # plain dicts from stored segments ({"start": ..., "text": ...}).  The
+    # shape is homogeneous within one transcript, so decide once from the
+    # first element and fetch both fields with a single C-level getter
+    # call per snippet — no per-snippet isinstance branch or second
+    # lookup for multi-thousand-segment transcripts.
+    if isinstance(first, dict):
+        get_fields = itemgetter("start", "text")
+    else:
+        get_fields = attrgetter("start", "text")
+
+    # The document is accumulated straight into one StringIO buffer: each
+    # panel is written the moment its paragraph is flushed, so there's no
+    # intermediate section list plus a second O(total) join pass — the
+    # HTML is built in a single pass over memory.
+    out = io.StringIO()
+    write = out.write
+    if full_document:
+        write(_HTML_PRE)
+        write(title)
+        write(_HTML_MID)
+        write(title)
+        write(_HTML_SEP)
+
+    first_panel = True
+
+    def flush_panel(start_secs: float, texts: list[str]) -> None:
+        """Write one collapsible panel (styled like an antd Collapse.Panel).
+
+        The summary bar shows the timestamp as a pill badge plus the first
+        75 characters of the paragraph text as a preview.
+        """
+        nonlocal first_panel
+        if first_panel:
+            first_panel = False
         else:
-            start = snippet.start
-            text = snippet.text
-
-        # Decide whether this segment starts a new section.  A new
-        # section begins when (a) it's the very first segment, or
-        # (b) the segment's start time has crossed into the next
-        # 30-second bucket.
-        if paragraph_start is None:
-            # Very first segment — begin the first section.
-            paragraph_start = start
-            current_texts.append(text)
-        elif start - paragraph_start >= _DOC_PARAGRAPH_INTERVAL_SECS:
+            write("\n\n")
+        para = " ".join(texts)
+        write(_PANEL_OPEN)
+        write(_seconds_to_mmss(start_secs))
+        write(_PANEL_AFTER_TS)
+        write(para[:75] + "..." if len(para) > 75 else para)
+        write(_PANEL_AFTER_PREVIEW)
+        write(para)
+        write(_PANEL_CLOSE)
+
+    # Seed the first paragraph from the first segment, so the scan loop
+    # only has one branch per segment: "did this start time cross the
+    # current paragraph's boundary?".  The boundary is precomputed when a
+    # paragraph opens, replacing a subtraction + comparison per segment
+    # with a single comparison.
+    # Local alias so boundary updates read the interval via LOAD_FAST
+    # instead of a module-global lookup per paragraph.
+    interval = _DOC_PARAGRAPH_INTERVAL_SECS
+
+    paragraph_start, first_text = get_fields(first)
+    next_boundary = paragraph_start + interval
+    current_texts = [first_text]
+
+    for snippet in iterator:
+        start, text = get_fields(snippet)
+        if start >= next_boundary:
             # Time threshold crossed — flush the current section and
             # start a new one.
-            timestamp = _seconds_to_mmss(paragraph_start)
-            sections.append(_format_details_block(timestamp, " ".join(current_texts)))
+            flush_panel(paragraph_start, current_texts)
             paragraph_start = start
+            next_boundary = start + interval
             current_texts = [text]
         else:
             # Still within the same time bucket — append to current section.
             current_texts.append(text)
 
-    # Flush the last section (if any segments existed).
-    if current_texts and paragraph_start is not None:
-        timestamp = _seconds_to_mmss(paragraph_start)
-        sections.append(_format_details_block(timestamp, " ".join(current_texts)))
-
-    if not sections:
-        return ""
-
-    # Wrap the collapsible sections in a full HTML document so the file
-    # renders properly when opened directly in a browser.
-    body = "\n\n".join(sections)
-    return _HTML_TEMPLATE.format(title=title, body=body)
+    # Flush the last section and close out the document wrapper.
+    flush_panel(paragraph_start, current_texts)
+    if full_document:
+        write(_HTML_POST)
+    return out.getvalue()
 
 
 # ---------------------------------------------------------------------------
 # High-level convenience function (main public API)
 # ---------------------------------------------------------------------------
 
+# Serialises the persistence phase of concurrent extract(save=True) calls.
+# Each call opens its own DuckDB connection, and DuckDB aborts concurrent
+# transactions that touch the same catalog entries ("write-write conflict"),
+# so parallel saves into one database file would mostly fail.  The network
+# fetches — the slow part — still overlap freely; only the local write is
+# single-file.
+_save_lock = threading.Lock()
+
+
+def _fetch_transcript_with_metadata(
+    video_id: str,
+    languages: list[str] | None = None,
+    *,
+    metadata_cache: bool = False,
+):
+    """
+    Fetch the transcript and video metadata for one video (blocking).
+
+    The metadata fetch (yt-dlp) and the transcript fetch are two independent
+    network round-trips; overlapping them means the caller waits
+    max(t_meta, t_transcript) instead of their sum.  A transcript failure
+    propagates first, as it would if the calls were sequential.
+
+    Shared by extract(save=True) and the API's save path (which persists
+    through its own long-lived store).  Returns (transcript, metadata).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from yt_transcript_extractor.metadata import (
+        fetch_video_metadata,
+        fetch_video_metadata_cached,
+    )
+
+    fetcher = fetch_video_metadata_cached if metadata_cache else fetch_video_metadata
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        meta_future = pool.submit(fetcher, video_id)
+        transcript = get_transcript(video_id, languages=languages)
+        metadata = meta_future.result()
+    return transcript, metadata
+
+
 def extract(
     url_or_id: str,
     languages: list[str] | None = None,
@@ -512,6 +771,7 @@ def extract(
     *,
     save: bool = False,
     db_path: str | None = None,
+    metadata_cache: bool = False,
 ) -> str | dict:
     """
     One-call interface: parse URL → fetch transcript → format output.
@@ -524,7 +784,9 @@ def extract(
     (channel name, video title, upload date) is fetched via yt-dlp.
 
     Args:
-        url_or_id:  A YouTube URL or raw video ID.
+        url_or_id:  A YouTube URL or raw video ID.  Pass a VideoID (the
+                    wrapped result of a prior parse_video_id call) to skip
+                    re-parsing in batch loops.
         languages:  Optional language priority list (e.g. ["de", "en"]).
         fmt:        Output format — "text" for plain text, "json" for a dict
                     with timestamps, "doc" for a readable markdown document
@@ -533,6 +795,10 @@ def extract(
                     yt-dlp and duckdb (both are installed dependencies).
         db_path:    Path to the DuckDB file.  Defaults to "transcripts.duckdb"
                     in the current working directory.  Only used when save=True.
+        metadata_cache: If True, metadata lookups go through the persistent
+                    on-disk cache (fetch_video_metadata_cached), skipping the
+                    yt-dlp fetch for recently-seen videos.  Only used when
+                    save=True.
 
     Returns:
         A plain-text string (fmt="text"), a dict (fmt="json"), or a markdown
@@ -547,8 +813,9 @@ def extract(
     if fmt not in ("text", "json", "doc"):
         raise ValueError(f"Unknown format {fmt!r}; expected 'text', 'json', or 'doc'")
 
-    video_id = parse_video_id(url_or_id)
-    transcript = get_transcript(video_id, languages=languages)
+    # A VideoID marks input that a caller already ran through
+    # parse_video_id(), so re-parsing would be pure overhead in batch loops.
+    video_id = url_or_id if isinstance(url_or_id, VideoID) else parse_video_id(url_or_id)
 
     # Optionally persist the transcript to DuckDB.  Imports are inside the
     # if-block so the default (save=False) path has zero overhead from yt-dlp
@@ -558,14 +825,17 @@ def extract(
     # HTML <title> and <h1>.
     doc_title = "Transcript"
     if save:
-        from yt_transcript_extractor.metadata import fetch_video_metadata
         from yt_transcript_extractor.storage import TranscriptStore
 
-        metadata = fetch_video_metadata(video_id)
+        transcript, metadata = _fetch_transcript_with_metadata(
+            video_id, languages, metadata_cache=metadata_cache,
+        )
         doc_title = metadata.title
         store_path = db_path or "transcripts.duckdb"
-        with TranscriptStore(store_path) as store:
+        with _save_lock, TranscriptStore(store_path) as store:
             store.save_transcript(video_id, transcript, metadata)
+    else:
+        transcript = get_transcript(video_id, languages=languages)
 
     if fmt == "json":
         return format_json(transcript, video_id)
@@ -14,25 +14,55 @@ transcripts by channel in the database.
 
 from __future__ import annotations
 
+import functools
+import json
+import os
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime, timedelta
 
+import duckdb
 import yt_dlp
 
 from yt_transcript_extractor.errors import MetadataFetchError
 
 
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# On-disk metadata cache location.  Expands ~ at runtime so it works on any
+# user's machine.  Kept outside the transcript database because the cache is
+# disposable — deleting it only costs a re-fetch.
+_METADATA_CACHE_PATH = os.path.join("~", ".cache", "yt-transcripts", "metadata_cache.duckdb")
+
+# How long a cached metadata entry stays valid.  Video titles and channel
+# names change rarely, so 24 hours is a comfortable default.
+_METADATA_CACHE_TTL_SECS = 24 * 60 * 60
+
+# Schema for the cache table.  payload holds the VideoMetadata fields as
+# JSON; fetched_at drives TTL expiry.
+_CACHE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS metadata_cache (
+    video_id   VARCHAR PRIMARY KEY,
+    payload    JSON NOT NULL,
+    fetched_at TIMESTAMP DEFAULT current_timestamp
+);
+"""
+
+
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoMetadata:
     """
     Structured metadata for a single YouTube video.
 
     All fields come from yt-dlp's info_dict.  frozen=True makes instances
-    hashable and prevents accidental mutation after creation.
+    hashable and prevents accidental mutation after creation; slots=True
+    drops the per-instance __dict__, which matters when batch saves hold
+    thousands of these in memory.
 
     Attributes:
         video_id:     The 11-character YouTube video identifier.
@@ -57,6 +87,26 @@ class VideoMetadata:
 # Metadata fetching
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
+def _get_ydl() -> yt_dlp.YoutubeDL:
+    """
+    Return the shared metadata-only YoutubeDL instance, built on first use.
+
+    YoutubeDL's constructor compiles extractor tables and parses options —
+    tens of milliseconds that batch callers would otherwise pay per video.
+    skip_download means the instance holds no per-video state, so reuse is
+    safe; quiet/no_warnings suppress console output since we only want the
+    info_dict.
+    """
+    return yt_dlp.YoutubeDL(
+        {
+            "skip_download": True,
+            "quiet": True,
+            "no_warnings": True,
+        }
+    )
+
+
 def fetch_video_metadata(video_id: str) -> VideoMetadata:
     """
     Fetch metadata for a YouTube video without downloading the video itself.
@@ -75,19 +125,17 @@ def fetch_video_metadata(video_id: str) -> VideoMetadata:
         MetadataFetchError: If yt-dlp can't retrieve the video info
             (e.g. video doesn't exist, is private, or network error).
     """
-    # yt-dlp options: skip_download avoids downloading media; quiet and
-    # no_warnings suppress console output since we only want the info_dict.
-    ydl_opts = {
-        "skip_download": True,
-        "quiet": True,
-        "no_warnings": True,
-    }
-
     url = f"https://www.youtube.com/watch?v={video_id}"
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        # process=False stops yt-dlp after the initial page extraction,
+        # skipping format resolution and player-JS signature work.  All
+        # the fields we need (title, channel, upload date, duration) are
+        # already present in the unprocessed result, so this trims the
+        # single yt-dlp invocation down to one page fetch.  The shared
+        # instance is called directly (no with-block) so its session and
+        # extractor state survive across calls.
+        info = _get_ydl().extract_info(url, download=False, process=False)
     except yt_dlp.utils.DownloadError as exc:
         # yt-dlp raises DownloadError for any extraction failure — missing
         # video, geo-restriction, rate-limiting, etc.  We wrap it in our
@@ -105,12 +153,11 @@ def fetch_video_metadata(video_id: str) -> VideoMetadata:
     upload_date: date | None = None
     if raw_date:
         try:
-            upload_date = date(
-                year=int(raw_date[:4]),
-                month=int(raw_date[4:6]),
-                day=int(raw_date[6:8]),
-            )
-        except (ValueError, IndexError):
+            # date.fromisoformat accepts the compact YYYYMMDD form since
+            # Python 3.11 and parses it in one C call, replacing three
+            # int() invocations plus the date() constructor.
+            upload_date = date.fromisoformat(raw_date)
+        except (ValueError, TypeError):
             # Malformed date string — not critical, just leave it as None.
             upload_date = None
 
@@ -123,3 +170,146 @@ def fetch_video_metadata(video_id: str) -> VideoMetadata:
         upload_date=upload_date,
         duration_secs=info.get("duration"),
     )
+
+
+# ---------------------------------------------------------------------------
+# Metadata caching — avoids re-running yt-dlp for recently-seen videos
+# ---------------------------------------------------------------------------
+
+def _cache_lookup(
+    video_id: str, cache_path: str, ttl_secs: int
+) -> tuple[VideoMetadata, datetime] | None:
+    """
+    Look up a video in the on-disk metadata cache.
+
+    Returns (metadata, fetched_at) if present and fresher than ttl_secs,
+    otherwise None.  Any cache failure (missing file, corrupt payload) is
+    treated as a miss — the cache is an optimization, never a requirement.
+    """
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        with duckdb.connect(cache_path) as conn:
+            conn.execute(_CACHE_SCHEMA_SQL)
+            row = conn.execute(
+                "SELECT payload, fetched_at FROM metadata_cache WHERE video_id = ?",
+                [video_id],
+            ).fetchone()
+    except duckdb.Error:
+        return None
+
+    if row is None:
+        return None
+
+    payload, fetched_at = row
+    if datetime.now() - fetched_at > timedelta(seconds=ttl_secs):
+        return None
+
+    try:
+        fields = json.loads(payload)
+        raw_date = fields.pop("upload_date")
+        fields["upload_date"] = date.fromisoformat(raw_date) if raw_date else None
+        return VideoMetadata(**fields), fetched_at
+    except (ValueError, TypeError, KeyError):
+        # Corrupt or stale-format payload — treat as a miss.
+        return None
+
+
+def _cache_store(metadata: VideoMetadata, cache_path: str) -> None:
+    """
+    Write freshly-fetched metadata to the on-disk cache.
+
+    Creates the cache directory and database on first use.  Failures are
+    silently ignored — a broken cache must never fail the actual fetch.
+    """
+    payload = json.dumps({
+        "video_id": metadata.video_id,
+        "title": metadata.title,
+        "channel_id": metadata.channel_id,
+        "channel_name": metadata.channel_name,
+        "channel_url": metadata.channel_url,
+        "upload_date": metadata.upload_date.isoformat() if metadata.upload_date else None,
+        "duration_secs": metadata.duration_secs,
+    })
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with duckdb.connect(cache_path) as conn:
+            conn.execute(_CACHE_SCHEMA_SQL)
+            conn.execute(
+                """
+                INSERT INTO metadata_cache (video_id, payload)
+                VALUES (?, ?)
+                ON CONFLICT (video_id) DO UPDATE SET
+                    payload    = excluded.payload,
+                    fetched_at = now()
+                """,
+                [metadata.video_id, payload],
+            )
+    except (OSError, duckdb.Error):
+        pass
+
+
+# In-process memo of (metadata, fetched_at), sparing repeat lookups the
+# disk-cache connection open.  Unlike a bare lru_cache, every entry keeps
+# its original fetch time so the TTL still applies inside long-running
+# processes (API server, repl) — a hit past the TTL is refetched, not
+# served stale forever.  Bounded like the lru_cache it replaced; eviction
+# is oldest-inserted-first, which is close enough to LRU at this size.
+_MEMO_MAX_ENTRIES = 128
+_metadata_memo: dict[str, tuple[VideoMetadata, datetime]] = {}
+
+
+def _memo_store(video_id: str, metadata: VideoMetadata, fetched_at: datetime) -> None:
+    """Insert into the in-process memo, evicting the oldest entry if full."""
+    if len(_metadata_memo) >= _MEMO_MAX_ENTRIES:
+        _metadata_memo.pop(next(iter(_metadata_memo)))
+    _metadata_memo[video_id] = (metadata, fetched_at)
+
+
+def fetch_video_metadata_cached(
+    video_id: str,
+    ttl_secs: int = _METADATA_CACHE_TTL_SECS,
+) -> VideoMetadata:
+    """
+    Like fetch_video_metadata(), but with a persistent on-disk cache.
+
+    Consults an in-process memo, then a small DuckDB cache in
+    ~/.cache/yt-transcripts/; on a hit fresher than ttl_secs, the yt-dlp
+    fetch (and its player-JS parsing) is skipped entirely.  On a miss —
+    including an expired entry at either layer — the metadata is fetched
+    normally and written back to both.
+
+    Args:
+        video_id: The 11-character YouTube video ID.
+        ttl_secs: Maximum age of a cache entry before it's refreshed.
+                  Defaults to 24 hours.
+
+    Returns:
+        A VideoMetadata dataclass, from cache or freshly fetched.
+
+    Raises:
+        MetadataFetchError: On a cache miss, if the underlying fetch fails.
+    """
+    now = datetime.now()
+
+    hit = _metadata_memo.get(video_id)
+    if hit is not None:
+        metadata, fetched_at = hit
+        if now - fetched_at <= timedelta(seconds=ttl_secs):
+            return metadata
+        del _metadata_memo[video_id]
+
+    cache_path = os.path.expanduser(_METADATA_CACHE_PATH)
+
+    cached = _cache_lookup(video_id, cache_path, ttl_secs)
+    if cached is not None:
+        metadata, fetched_at = cached
+        _memo_store(video_id, metadata, fetched_at)
+        return metadata
+
+    metadata = fetch_video_metadata(video_id)
+    _cache_store(metadata, cache_path)
+    _memo_store(video_id, metadata, now)
+    return metadata
@@ -21,6 +21,7 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
 from datetime import date, datetime
 
@@ -244,6 +245,12 @@ class TranscriptStore:
             if self.has_video(video_id):
                 return SaveResult(video_id=video_id, already_existed=True)
 
+            # All writes below go out in a single transaction: the save is
+            # atomic (a failed segment insert can't leave an orphaned
+            # channel/video row) and DuckDB checkpoints once at COMMIT
+            # instead of after every statement.
+            self.conn.execute("BEGIN TRANSACTION")
+
             # Upsert the channel: insert if new, update name/url if it
             # already exists (channels can rename themselves over time).
             self.conn.execute(
@@ -308,9 +315,17 @@ class TranscriptStore:
                     segments,
                 )
 
+            self.conn.execute("COMMIT")
+
             return SaveResult(video_id=video_id, already_existed=False)
 
         except duckdb.Error as exc:
+            # Roll back whatever part of the transaction was open.  DuckDB
+            # raises if no transaction is active, so swallow that case.
+            try:
+                self.conn.execute("ROLLBACK")
+            except duckdb.Error:
+                pass
             raise StorageError(f"Failed to save transcript for {video_id}: {exc}") from exc
 
     # --- Read operations ---
@@ -325,24 +340,86 @@ class TranscriptStore:
         Returns:
             True if the video exists in the videos table, False otherwise.
         """
+        # video_id is the primary key, so at most one row matches; LIMIT 1
+        # lets the scan stop at the first hit instead of draining the table.
         result = self.conn.execute(
-            "SELECT 1 FROM videos WHERE video_id = ?",
+            "SELECT 1 FROM videos WHERE video_id = ? LIMIT 1",
             [video_id],
         ).fetchone()
         return result is not None
 
-    def list_channels(self) -> list[ChannelRecord]:
+    def get_transcript_hash(self, video_id: str) -> str | None:
+        """
+        Return a stable content hash for a stored transcript.
+
+        Saved transcripts are immutable (save_transcript never overwrites),
+        so the segment count and final timestamp uniquely identify the
+        stored content — hashing those is far cheaper than hashing every
+        segment's text.  Used by the API as an HTTP ETag.
+
+        Args:
+            video_id: The 11-character YouTube video ID.
+
+        Returns:
+            A hex digest string, or None if the video has no stored segments.
+        """
+        row = self.conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(MAX(start), 0)
+            FROM transcript_segments
+            WHERE video_id = ?
+            """,
+            [video_id],
+        ).fetchone()
+        if row is None or row[0] == 0:
+            return None
+        return hashlib.md5(f"{video_id}:{row[0]}:{row[1]}".encode()).hexdigest()
+
+    def get_video_title_and_channel(self, video_id: str) -> tuple[str, str] | None:
+        """
+        Look up a saved video's title and channel name in a single query.
+
+        Used by the CLI's auto-output-path logic, which only needs these two
+        fields — one joined lookup here replaces a has_video() check plus a
+        separate join query.
+
+        Args:
+            video_id: The 11-character YouTube video ID.
+
+        Returns:
+            A (title, channel_name) tuple, or None if the video isn't stored.
+        """
+        row = self.conn.execute(
+            """
+            SELECT v.title, c.channel_name
+            FROM videos v
+            JOIN channels c ON v.channel_id = c.channel_id
+            WHERE v.video_id = ?
+            """,
+            [video_id],
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def list_channels(
+        self,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[ChannelRecord]:
         """
         List all channels that have saved videos, sorted alphabetically.
 
         Returns a list of ChannelRecord dataclasses, each including a count
         of how many videos have been saved from that channel.
 
+        Args:
+            limit:  Maximum number of channels to return.  None (default)
+                    returns everything.
+            offset: Number of channels to skip from the start (for paging).
+
         Returns:
             A list of ChannelRecord objects, sorted by channel_name (case-insensitive).
         """
-        rows = self.conn.execute(
-            """
+        sql = """
             SELECT
                 c.channel_id,
                 c.channel_name,
@@ -354,7 +431,12 @@ class TranscriptStore:
             HAVING COUNT(v.video_id) > 0
             ORDER BY LOWER(c.channel_name)
             """
-        ).fetchall()
+        params: list = []
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+
+        rows = self.conn.execute(sql, params).fetchall()
 
         return [
             ChannelRecord(
@@ -366,19 +448,26 @@ class TranscriptStore:
             for row in rows
         ]
 
-    def list_videos(self, channel_id: str) -> list[VideoRecord]:
+    def list_videos(
+        self,
+        channel_id: str,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[VideoRecord]:
         """
         List all saved videos for a given channel, newest first.
 
         Args:
             channel_id: YouTube's internal channel identifier.
+            limit:      Maximum number of videos to return.  None (default)
+                        returns everything.
+            offset:     Number of videos to skip from the start (for paging).
 
         Returns:
             A list of VideoRecord objects sorted by upload_date descending
             (newest first).  Videos without an upload_date sort last.
         """
-        rows = self.conn.execute(
-            """
+        sql = """
             SELECT
                 video_id, title, channel_id, upload_date,
                 duration_secs, language, language_code, is_generated,
@@ -386,9 +475,13 @@ class TranscriptStore:
             FROM videos
             WHERE channel_id = ?
             ORDER BY upload_date DESC NULLS LAST
-            """,
-            [channel_id],
-        ).fetchall()
+            """
+        params: list = [channel_id]
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+
+        rows = self.conn.execute(sql, params).fetchall()
 
         return [
             VideoRecord(
@@ -461,6 +554,47 @@ class TranscriptStore:
 
         return "\n".join(row[0] for row in rows)
 
+    def iter_transcript_text(self, video_id: str, batch_size: int = 500):
+        """
+        Yield a stored transcript's plain text in bounded-size chunks.
+
+        Streaming counterpart to get_transcript_text(): instead of
+        materializing the whole transcript string, segments are fetched in
+        batches of batch_size rows and yielded as joined text, keeping peak
+        memory at O(batch_size) regardless of transcript length.
+        Concatenating every yielded chunk reproduces get_transcript_text()
+        byte-for-byte.
+
+        Args:
+            video_id:   The 11-character YouTube video ID.
+            batch_size: Number of segments fetched per database round-trip.
+
+        Yields:
+            Text chunks with one segment per line.  Yields nothing if the
+            video isn't stored.
+        """
+        last_seq = -1
+        while True:
+            rows = self.conn.execute(
+                """
+                SELECT seq, text
+                FROM transcript_segments
+                WHERE video_id = ? AND seq > ?
+                ORDER BY seq
+                LIMIT ?
+                """,
+                [video_id, last_seq, batch_size],
+            ).fetchall()
+
+            if not rows:
+                return
+
+            # Separate batches with the newline that would have joined them
+            # in the single-string version (no leading newline on the first).
+            prefix = "" if last_seq < 0 else "\n"
+            last_seq = rows[-1][0]
+            yield prefix + "\n".join(row[1] for row in rows)
+
     def get_transcript_doc(self, video_id: str) -> str:
         """
         Retrieve a stored transcript as an HTML document with collapsible sections.
@@ -499,16 +633,28 @@ class TranscriptStore:
 
         return format_doc(segments, title=title)
 
-    def search_transcripts(self, query: str) -> list[dict]:
+    def search_transcripts(
+        self,
+        query: str,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict]:
         """
         Search across all saved transcripts for segments matching a query.
 
-        Uses case-insensitive substring matching (ILIKE) on the segment text.
-        Results are grouped by video and ordered by relevance (videos with
-        more matching segments first, then by sequence within each video).
+        Matching is a case-insensitive substring check (ILIKE), and
+        results are ordered by video title then segment sequence, so the
+        result set, its order, and paging are deterministic everywhere.
+        (An earlier version pre-filtered through DuckDB's FTS index, but
+        token matching is never a superset of substring matching —
+        partial-word queries like "ever" silently lost rows — so search
+        is a plain scan; at this database's scale that's plenty fast.)
 
         Args:
-            query: The search string.  Matched as a substring (not regex).
+            query:  The search string.
+            limit:  Maximum number of matches to return.  None (default)
+                    returns everything.
+            offset: Number of matches to skip from the start (for paging).
 
         Returns:
             A list of dicts, each containing:
@@ -520,8 +666,7 @@ class TranscriptStore:
                 - start: timestamp in seconds where the segment begins
                 - duration: segment duration in seconds
         """
-        rows = self.conn.execute(
-            """
+        sql = """
             SELECT
                 ts.video_id,
                 v.title,
@@ -535,9 +680,13 @@ class TranscriptStore:
             JOIN channels c ON v.channel_id = c.channel_id
             WHERE ts.text ILIKE ?
             ORDER BY v.title, ts.seq
-            """,
-            [f"%{query}%"],
-        ).fetchall()
+            """
+        params: list = [f"%{query}%"]
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+
+        rows = self.conn.execute(sql, params).fetchall()
 
         return [
             {
@@ -0,0 +1,187 @@
+"""
+conftest.py — Shared fixtures, fakes, and mock factories for the test suite.
+
+Holds the pieces more than one test file (or future test file) needs:
+the fake transcript types, the sample metadata, the session-scoped
+in-memory TranscriptStore, and the autospec'd store mock factory.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import date
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+
+from yt_transcript_extractor.metadata import VideoMetadata
+from yt_transcript_extractor.storage import TranscriptStore
+
+
+# ---------------------------------------------------------------------------
+# Fake transcript objects that mimic FetchedTranscript
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class FakeSnippet:
+    """
+    Mimics a FetchedTranscriptSnippet with .text, .start, .duration.
+
+    Used to build fake transcripts for testing without importing the real
+    youtube-transcript-api types.
+    """
+
+    text: str
+    start: float
+    duration: float
+
+
+class _FakeTranscript:
+    """
+    Minimal FetchedTranscript stand-in — a plain class instead of a
+    MagicMock: attribute and method access are ordinary lookups rather
+    than mock dispatch, and iteration restarts every time so one instance
+    can be shared across tests and saves.  Covers the interface the code
+    under test actually touches: iteration over snippets, the language
+    attributes TranscriptStore reads during save_transcript(), and
+    .to_raw_data() for format_json().
+    """
+
+    __slots__ = ("_snippets", "language", "language_code", "is_generated")
+
+    def __init__(
+        self,
+        snippets: list[FakeSnippet],
+        language: str = "English",
+        language_code: str = "en",
+        is_generated: bool = False,
+    ) -> None:
+        self._snippets = snippets
+        self.language = language
+        self.language_code = language_code
+        self.is_generated = is_generated
+
+    def __iter__(self):
+        return iter(self._snippets)
+
+    def to_raw_data(self) -> list[dict]:
+        return [
+            {"text": s.text, "start": s.start, "duration": s.duration}
+            for s in self._snippets
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Sample data
+# ---------------------------------------------------------------------------
+
+# VideoMetadata is frozen, so the no-overrides default is built once and
+# shared by every test.
+_DEFAULT_META = VideoMetadata(
+    video_id="dQw4w9WgXcQ",
+    title="Never Gonna Give You Up",
+    channel_id="UCuAXFkgsw1L7xaCfnd5JJOw",
+    channel_name="Rick Astley",
+    channel_url="https://www.youtube.com/channel/UCuAXFkgsw1L7xaCfnd5JJOw",
+    upload_date=date(2009, 10, 25),
+    duration_secs=213,
+)
+
+
+def _sample_metadata(**overrides) -> VideoMetadata:
+    """
+    Sample VideoMetadata for testing — the cached default, or a copy with
+    any field overridden.  A channel_id override also rewrites channel_url
+    so the two stay consistent.
+    """
+    if not overrides:
+        return _DEFAULT_META
+    if "channel_id" in overrides and "channel_url" not in overrides:
+        overrides["channel_url"] = (
+            f"https://www.youtube.com/channel/{overrides['channel_id']}"
+        )
+    return replace(_DEFAULT_META, **overrides)
+
+
+_SAMPLE_SEGMENTS = [
+    {"text": "Never gonna give you up", "start": 0.0, "duration": 2.5},
+    {"text": "Never gonna let you down", "start": 2.5, "duration": 2.5},
+    {"text": "Never gonna run around and desert you", "start": 5.0, "duration": 3.0},
+]
+
+# Snippets are immutable, so one shared list serves every test.
+_SAMPLE_SNIPS = [FakeSnippet(**s) for s in _SAMPLE_SEGMENTS]
+
+
+# ---------------------------------------------------------------------------
+# Shared store fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def store() -> TranscriptStore:
+    """
+    One in-memory TranscriptStore for the whole session.
+
+    The schema is created once, and nothing touches disk.  Test files
+    using this must clean up their own rows (test_storage.py does so with
+    an autouse fixture) so tests stay isolated.
+    """
+    with TranscriptStore(":memory:") as shared:
+        yield shared
+
+
+@pytest.fixture()
+def saved_rick(store: TranscriptStore):
+    """
+    Save the standard Rick Astley sample into the shared store.
+
+    Most save-path tests need exactly this one video saved; doing it in
+    a fixture keeps each test down to its post-state assertions.  Yields
+    the SaveResult so tests can assert on it directly.
+    """
+    return store.save_transcript(
+        "dQw4w9WgXcQ", _FakeTranscript(_SAMPLE_SNIPS), _sample_metadata()
+    )
+
+
+def _bulk_save(
+    store: TranscriptStore,
+    items: list[tuple[str, _FakeTranscript, VideoMetadata]],
+) -> None:
+    """
+    Save several (video_id, transcript, metadata) triples in one call.
+
+    save_transcript() already wraps each save in its own transaction, so
+    this can't add an outer BEGIN/COMMIT around the loop — it exists to
+    keep multi-video setup to one line per test and give bulk ingestion
+    a single seam if the store ever grows a batched save API.
+    """
+    for video_id, transcript, metadata in items:
+        store.save_transcript(video_id, transcript, metadata)
+
+
+# ---------------------------------------------------------------------------
+# Mock factories
+# ---------------------------------------------------------------------------
+
+def make_store_mock(**attrs) -> tuple[MagicMock, MagicMock]:
+    """
+    Build a pre-wired context-manager mock for TranscriptStore.
+
+    Returns (cm, store): patch TranscriptStore so constructing it yields
+    cm, then assert against store (what `with ... as store:` binds).
+    Keyword arguments become method return values on the instance, e.g.
+    make_store_mock(has_video=True, get_transcript=[...]).
+
+    create_autospec validates that every configured method actually exists
+    on TranscriptStore, so a renamed store method fails these tests instead
+    of silently passing against a stale hand-rolled mock — and the spec is
+    built once per call instead of six lines of attribute wiring per test.
+    """
+    store = create_autospec(TranscriptStore, instance=True)
+    for name, value in attrs.items():
+        getattr(store, name).return_value = value
+    cm = MagicMock()
+    cm.__enter__ = MagicMock(return_value=store)
+    cm.__exit__ = MagicMock(return_value=False)
+    return cm, store
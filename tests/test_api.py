@@ -1,17 +1,22 @@
 """
 test_api.py — Tests for the FastAPI web API endpoints.
 
-Uses FastAPI's TestClient (backed by httpx) so tests run in-process without
-needing a live server.  Transcript fetching and storage are mocked so these
-tests are fast and don't require network access or a real database.
+Uses httpx.AsyncClient over an ASGITransport so requests hit the app
+in-process without a live server or TestClient's sync-over-async thread
+portal.  Transcript fetching and storage are mocked so these tests are
+fast and don't require network access or a real database.
 """
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import threading
+from unittest.mock import MagicMock
 
+import httpx
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+from tests.conftest import _SAMPLE_SNIPS, _FakeTranscript, _sample_metadata
 
 from yt_transcript_extractor.api import app
 from yt_transcript_extractor.errors import (
@@ -21,14 +26,84 @@ from yt_transcript_extractor.errors import (
 )
 from yt_transcript_extractor.storage import ChannelRecord, VideoRecord
 
+# Run every async test on asyncio via anyio's pytest plugin (anyio is
+# already in the tree as a FastAPI dependency).
+pytestmark = pytest.mark.anyio
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Session-scoped backend selection so the client fixture can share it."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def client() -> httpx.AsyncClient:
+    """
+    One AsyncClient shared by the whole session.
+
+    Requests go straight through the ASGI transport on the test's event
+    loop — no thread portal like TestClient, and no per-test client
+    rebuild.  Per-test state lives in the mocks and the store cache
+    (reset by _reset_store_cache below).  The app lifespan is deliberately
+    not entered: it warms the on-disk default store, which tests must not
+    touch.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def _reset_store_cache():
+    """
+    Clear the API's per-path TranscriptStore cache around every test.
+
+    The API caches store instances across requests, so without this a
+    mocked store from one test would leak into the next.
+    """
+    from yt_transcript_extractor.api import _close_stores
+
+    _close_stores()
+    yield
+    _close_stores()
+
+
+@pytest.fixture()
+def mock_extract(monkeypatch) -> MagicMock:
+    """
+    Swap api.extract for a MagicMock for the duration of one test.
+
+    monkeypatch installs the attribute once and batches the teardown in its
+    finalizer, which is lighter than a unittest.mock._patch enter/exit pair
+    per test.
+    """
+    m = MagicMock()
+    monkeypatch.setattr("yt_transcript_extractor.api.extract", m)
+    return m
+
+
 @pytest.fixture()
-def client() -> TestClient:
-    """Create a fresh TestClient for each test."""
-    return TestClient(app)
+def mock_store(monkeypatch) -> MagicMock:
+    """
+    Swap api.TranscriptStore for a mock class; returns the instance mock.
+
+    The API constructs TranscriptStore(db) per cached store, so tests only
+    ever interact with the constructed instance — the fixture hands that
+    back directly.
+    """
+    mock_cls = MagicMock()
+    monkeypatch.setattr("yt_transcript_extractor.api.TranscriptStore", mock_cls)
+    return mock_cls.return_value
+
+
+def _json(resp) -> dict:
+    """Parse a response body with orjson — one pass over resp.content."""
+    return orjson.loads(resp.content)
 
 
 # Sample data returned by mocked extract() calls.
@@ -50,11 +125,11 @@ _SAMPLE_JSON = {
 class TestHealth:
     """Tests for GET /health."""
 
-    def test_health_returns_ok(self, client: TestClient) -> None:
+    async def test_health_returns_ok(self, client: httpx.AsyncClient) -> None:
         """Health endpoint returns 200 with status ok."""
-        resp = client.get("/health")
+        resp = await client.get("/health")
         assert resp.status_code == 200
-        assert resp.json() == {"status": "ok"}
+        assert _json(resp) == {"status": "ok"}
 
 
 # ---------------------------------------------------------------------------
@@ -64,117 +139,277 @@ class TestHealth:
 class TestTranscriptEndpoint:
     """Tests for GET /transcript/{video_id} with mocked extraction."""
 
-    @patch("yt_transcript_extractor.api.extract")
-    def test_text_format(self, mock_extract: MagicMock, client: TestClient) -> None:
-        """Default format=text returns plain text with 200."""
-        mock_extract.return_value = _SAMPLE_TEXT
-
-        resp = client.get("/transcript/dQw4w9WgXcQ")
+    @pytest.mark.parametrize(
+        ("url", "body", "expected_kwargs"),
+        [
+            pytest.param(
+                "/transcript/dQw4w9WgXcQ",
+                _SAMPLE_TEXT,
+                {"languages": None, "fmt": "text"},
+                id="text-default",
+            ),
+            pytest.param(
+                "/transcript/dQw4w9WgXcQ?format=doc",
+                "<details>\n<summary>00:00</summary>\n\nHello world Second line\n\n</details>",
+                {"languages": None, "fmt": "doc"},
+                id="doc",
+            ),
+            # The lang query param is split and forwarded to extract().
+            pytest.param(
+                "/transcript/dQw4w9WgXcQ?lang=de,en",
+                _SAMPLE_TEXT,
+                {"languages": ["de", "en"], "fmt": "text"},
+                id="languages",
+            ),
+        ],
+    )
+    async def test_plain_text_responses(
+        self,
+        url: str,
+        body: str,
+        expected_kwargs: dict,
+        mock_extract: MagicMock,
+        client: httpx.AsyncClient,
+    ) -> None:
+        """Each query shape returns extract()'s output and forwards the right kwargs."""
+        mock_extract.return_value = body
+
+        resp = await client.get(url)
 
         assert resp.status_code == 200
-        assert resp.text == _SAMPLE_TEXT
-        # Verify extract() was called with the right arguments.
-        # save defaults to False, db_path is None when save is False.
-        mock_extract.assert_called_once_with(
-            "dQw4w9WgXcQ", languages=None, fmt="text",
-            save=False, db_path=None,
-        )
+        assert resp.text == body
+        mock_extract.assert_called_once_with("dQw4w9WgXcQ", **expected_kwargs)
 
-    @patch("yt_transcript_extractor.api.extract")
-    def test_doc_format(self, mock_extract: MagicMock, client: TestClient) -> None:
-        """format=doc returns markdown plain text with 200."""
-        doc_output = "<details>\n<summary>00:00</summary>\n\nHello world Second line\n\n</details>"
-        mock_extract.return_value = doc_output
+    async def test_save_routes_through_shared_store(
+        self,
+        monkeypatch,
+        mock_extract: MagicMock,
+        client: httpx.AsyncClient,
+    ) -> None:
+        """save=true persists via _extract_and_save, not a per-call extract()."""
+        save_mock = MagicMock(return_value=_SAMPLE_TEXT)
+        monkeypatch.setattr("yt_transcript_extractor.api._extract_and_save", save_mock)
 
-        resp = client.get("/transcript/dQw4w9WgXcQ?format=doc")
+        resp = await client.get("/transcript/dQw4w9WgXcQ?save=true")
 
         assert resp.status_code == 200
-        # Doc format returns a string, so it gets a PlainTextResponse.
-        assert resp.text == doc_output
-        mock_extract.assert_called_once_with(
-            "dQw4w9WgXcQ", languages=None, fmt="doc",
-            save=False, db_path=None,
+        assert resp.text == _SAMPLE_TEXT
+        save_mock.assert_called_once_with(
+            "dQw4w9WgXcQ", None, "text", "transcripts.duckdb",
         )
+        mock_extract.assert_not_called()
 
-    @patch("yt_transcript_extractor.api.extract")
-    def test_json_format(self, mock_extract: MagicMock, client: TestClient) -> None:
+    async def test_json_format(self, mock_extract: MagicMock, client: httpx.AsyncClient) -> None:
         """format=json returns JSON body with 200."""
         mock_extract.return_value = _SAMPLE_JSON
 
-        resp = client.get("/transcript/dQw4w9WgXcQ?format=json")
+        resp = await client.get("/transcript/dQw4w9WgXcQ?format=json")
 
         assert resp.status_code == 200
-        data = resp.json()
+        data = _json(resp)
         assert data["video_id"] == "dQw4w9WgXcQ"
         assert data["segment_count"] == 2
 
-    @patch("yt_transcript_extractor.api.extract")
-    def test_language_param(self, mock_extract: MagicMock, client: TestClient) -> None:
-        """The lang query param is split and forwarded to extract()."""
-        mock_extract.return_value = _SAMPLE_TEXT
+    async def test_invalid_format_returns_422(self, client: httpx.AsyncClient) -> None:
+        """An unsupported format value is rejected by FastAPI validation (422)."""
+        resp = await client.get("/transcript/dQw4w9WgXcQ?format=xml")
+        assert resp.status_code == 422
 
-        resp = client.get("/transcript/dQw4w9WgXcQ?lang=de,en")
 
-        assert resp.status_code == 200
-        mock_extract.assert_called_once_with(
-            "dQw4w9WgXcQ", languages=["de", "en"], fmt="text",
-            save=False, db_path=None,
-        )
+# ---------------------------------------------------------------------------
+# Transcript endpoint — request coalescing
+# ---------------------------------------------------------------------------
 
-    @patch("yt_transcript_extractor.api.extract")
-    def test_save_param_passed_to_extract(self, mock_extract: MagicMock, client: TestClient) -> None:
-        """The save=true query param enables transcript persistence."""
-        mock_extract.return_value = _SAMPLE_TEXT
+class TestCoalescing:
+    """Tests for in-flight request coalescing on /transcript."""
+
+    async def test_owner_cancellation_does_not_poison_waiters(
+        self, mock_extract: MagicMock, client: httpx.AsyncClient
+    ) -> None:
+        """
+        A disconnected owner must not feed CancelledError to its waiters.
+
+        The first request in becomes the owner; when its client disconnects
+        Starlette cancels the handler task.  The extraction runs in a
+        separate shielded task, so coalesced waiters still get the result.
+        """
+        from yt_transcript_extractor import api
 
-        resp = client.get("/transcript/dQw4w9WgXcQ?save=true")
+        release = threading.Event()
 
+        def slow_extract(video_id, **kwargs):
+            release.wait(timeout=5)
+            return _SAMPLE_TEXT
+
+        mock_extract.side_effect = slow_extract
+
+        # Start the owner and wait until it has registered the in-flight
+        # future, so the second request is guaranteed to coalesce onto it.
+        owner = asyncio.ensure_future(client.get("/transcript/dQw4w9WgXcQ"))
+        for _ in range(100):
+            if api._inflight:
+                break
+            await asyncio.sleep(0.01)
+        assert api._inflight
+
+        waiter = asyncio.ensure_future(client.get("/transcript/dQw4w9WgXcQ"))
+        await asyncio.sleep(0.01)
+
+        # Simulate the owning client disconnecting, then let the (still
+        # running) extraction finish.
+        owner.cancel()
+        release.set()
+
+        resp = await waiter
         assert resp.status_code == 200
-        mock_extract.assert_called_once_with(
-            "dQw4w9WgXcQ", languages=None, fmt="text",
-            save=True, db_path="transcripts.duckdb",
-        )
+        assert resp.text == _SAMPLE_TEXT
+        # The waiter shared the owner's fetch rather than starting its own.
+        assert mock_extract.call_count == 1
 
-    def test_invalid_format_returns_422(self, client: TestClient) -> None:
-        """An unsupported format value is rejected by FastAPI validation (422)."""
-        resp = client.get("/transcript/dQw4w9WgXcQ?format=xml")
-        assert resp.status_code == 422
+        with pytest.raises(asyncio.CancelledError):
+            await owner
 
 
 # ---------------------------------------------------------------------------
-# Transcript endpoint — error cases
+# Batch endpoint
 # ---------------------------------------------------------------------------
 
-class TestTranscriptErrors:
-    """Tests that TranscriptError subclasses produce the correct HTTP status."""
+class TestBatchEndpoint:
+    """Tests for POST /batch with mocked extraction."""
 
-    @patch("yt_transcript_extractor.api.extract")
-    def test_video_not_found(self, mock_extract: MagicMock, client: TestClient) -> None:
-        """VideoNotFoundError → HTTP 404."""
-        mock_extract.side_effect = VideoNotFoundError("badid1234ab")
+    async def test_batch_success(self, mock_extract: MagicMock, client: httpx.AsyncClient) -> None:
+        """Each item gets its own status/body, indexed by position."""
+        mock_extract.return_value = _SAMPLE_TEXT
 
-        resp = client.get("/transcript/badid1234ab")
+        resp = await client.post("/batch", json={
+            "requests": [
+                {"video_id": "dQw4w9WgXcQ"},
+                {"video_id": "oHg5SJYRHA0", "format": "text"},
+            ],
+        })
 
-        assert resp.status_code == 404
-        assert "error" in resp.json()
+        assert resp.status_code == 200
+        responses = _json(resp)["responses"]
+        assert len(responses) == 2
+        assert responses[0] == {"id": 0, "status": 200, "body": _SAMPLE_TEXT}
+        assert responses[1]["id"] == 1
+        assert mock_extract.call_count == 2
+
+    async def test_batch_partial_failure(self, mock_extract: MagicMock, client: httpx.AsyncClient) -> None:
+        """A failing item reports its error in place without failing the batch."""
+        # Keyed on video_id because batch items run concurrently — a plain
+        # side_effect list would be consumed in completion order.
+        def fake_extract(video_id: str, **kwargs):
+            if video_id == "badid1234ab":
+                raise VideoNotFoundError(video_id)
+            return _SAMPLE_TEXT
+
+        mock_extract.side_effect = fake_extract
+
+        resp = await client.post("/batch", json={
+            "requests": [
+                {"video_id": "dQw4w9WgXcQ"},
+                {"video_id": "badid1234ab"},
+            ],
+        })
 
-    @patch("yt_transcript_extractor.api.extract")
-    def test_transcript_unavailable(self, mock_extract: MagicMock, client: TestClient) -> None:
-        """TranscriptUnavailableError → HTTP 404."""
-        mock_extract.side_effect = TranscriptUnavailableError("dQw4w9WgXcQ")
+        assert resp.status_code == 200
+        responses = _json(resp)["responses"]
+        assert responses[0]["status"] == 200
+        assert responses[1]["status"] == 404
+        assert "error" in responses[1]["body"]
+
+    async def test_batch_empty_returns_422(self, client: httpx.AsyncClient) -> None:
+        """An empty requests list is rejected by validation."""
+        resp = await client.post("/batch", json={"requests": []})
+        assert resp.status_code == 422
 
-        resp = client.get("/transcript/dQw4w9WgXcQ")
+    async def test_batch_saves_two_items_into_one_db(
+        self,
+        monkeypatch,
+        tmp_path,
+        client: httpx.AsyncClient,
+    ) -> None:
+        """
+        Two save=true items both land in the shared per-path store.
+
+        Batch items run concurrently, and per-item DuckDB connections on the
+        same file would abort each other with catalog write-write conflicts —
+        saves must go through the one cached store instead.  Network fetches
+        are mocked; storage is real.
+        """
+        from yt_transcript_extractor import api
+
+        db = str(tmp_path / "batch.duckdb")
+        monkeypatch.setattr(api, "_ALLOWED_DBS", frozenset({db}))
+        monkeypatch.setattr(
+            "yt_transcript_extractor.extractor.get_transcript",
+            lambda video_id, languages=None: _FakeTranscript(_SAMPLE_SNIPS),
+        )
+        monkeypatch.setattr(
+            "yt_transcript_extractor.metadata.fetch_video_metadata",
+            lambda video_id: _sample_metadata(),
+        )
 
-        assert resp.status_code == 404
+        resp = await client.post(
+            "/batch",
+            params={"db": db},
+            json={"requests": [
+                {"video_id": "dQw4w9WgXcQ", "save": True},
+                {"video_id": "oHg5SJYRHA0", "save": True},
+            ]},
+        )
 
-    @patch("yt_transcript_extractor.api.extract")
-    def test_language_not_available(self, mock_extract: MagicMock, client: TestClient) -> None:
-        """LanguageNotAvailableError → HTTP 400."""
-        mock_extract.side_effect = LanguageNotAvailableError("dQw4w9WgXcQ", ["xx"])
+        assert resp.status_code == 200
+        assert [r["status"] for r in _json(resp)["responses"]] == [200, 200]
+        with api._store_lock:
+            store = api._get_store(db)
+            assert store.has_video("dQw4w9WgXcQ")
+            assert store.has_video("oHg5SJYRHA0")
 
-        resp = client.get("/transcript/dQw4w9WgXcQ?lang=xx")
 
-        assert resp.status_code == 400
-        assert "error" in resp.json()
+# ---------------------------------------------------------------------------
+# Transcript endpoint — error cases
+# ---------------------------------------------------------------------------
+
+class TestTranscriptErrors:
+    """Tests that TranscriptError subclasses produce the correct HTTP status."""
+
+    @pytest.mark.parametrize(
+        ("url", "error", "expected_status"),
+        [
+            pytest.param(
+                "/transcript/badid1234ab",
+                VideoNotFoundError("badid1234ab"), 404,
+                id="video-not-found",
+            ),
+            pytest.param(
+                "/transcript/dQw4w9WgXcQ",
+                TranscriptUnavailableError("dQw4w9WgXcQ"), 404,
+                id="transcript-unavailable",
+            ),
+            pytest.param(
+                "/transcript/dQw4w9WgXcQ?lang=xx",
+                LanguageNotAvailableError("dQw4w9WgXcQ", ["xx"]), 400,
+                id="language-not-available",
+            ),
+        ],
+    )
+    async def test_error_status(
+        self,
+        url: str,
+        error: Exception,
+        expected_status: int,
+        mock_extract: MagicMock,
+        client: httpx.AsyncClient,
+    ) -> None:
+        """Each TranscriptError subclass maps to its stored HTTP status."""
+        mock_extract.side_effect = error
+
+        resp = await client.get(url)
+
+        assert resp.status_code == expected_status
+        assert "error" in _json(resp)
 
 
 # ---------------------------------------------------------------------------
@@ -184,10 +419,8 @@ class TestTranscriptErrors:
 class TestChannelsEndpoint:
     """Tests for GET /channels with mocked TranscriptStore."""
 
-    @patch("yt_transcript_extractor.api.TranscriptStore")
-    def test_list_channels(self, MockStore: MagicMock, client: TestClient) -> None:
+    async def test_list_channels(self, mock_store: MagicMock, client: httpx.AsyncClient) -> None:
         """Returns channel list with video counts."""
-        mock_store = MagicMock()
         mock_store.list_channels.return_value = [
             ChannelRecord(
                 channel_id="UC_test",
@@ -196,29 +429,28 @@ class TestChannelsEndpoint:
                 video_count=3,
             ),
         ]
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
-
-        resp = client.get("/channels")
+        resp = await client.get("/channels")
 
         assert resp.status_code == 200
-        data = resp.json()
+        data = _json(resp)
         assert len(data["channels"]) == 1
         assert data["channels"][0]["channel_name"] == "Test Channel"
         assert data["channels"][0]["video_count"] == 3
 
-    @patch("yt_transcript_extractor.api.TranscriptStore")
-    def test_list_channels_empty(self, MockStore: MagicMock, client: TestClient) -> None:
+    async def test_list_channels_empty(self, mock_store: MagicMock, client: httpx.AsyncClient) -> None:
         """Returns empty list when no channels are saved."""
-        mock_store = MagicMock()
         mock_store.list_channels.return_value = []
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
-
-        resp = client.get("/channels")
+        resp = await client.get("/channels")
 
         assert resp.status_code == 200
-        assert resp.json()["channels"] == []
+        assert _json(resp)["channels"] == []
+
+    async def test_unknown_db_rejected(self, mock_store: MagicMock, client: httpx.AsyncClient) -> None:
+        """A db path outside the operator allowlist is a 400, not an open."""
+        resp = await client.get("/channels", params={"db": "/tmp/evil.duckdb"})
+
+        assert resp.status_code == 400
+        mock_store.list_channels.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -228,11 +460,9 @@ class TestChannelsEndpoint:
 class TestVideosEndpoint:
     """Tests for GET /channels/{channel_id}/videos."""
 
-    @patch("yt_transcript_extractor.api.TranscriptStore")
-    def test_list_videos(self, MockStore: MagicMock, client: TestClient) -> None:
+    async def test_list_videos(self, mock_store: MagicMock, client: httpx.AsyncClient) -> None:
         """Returns video list for a channel."""
         from datetime import date, datetime
-        mock_store = MagicMock()
         mock_store.list_videos.return_value = [
             VideoRecord(
                 video_id="dQw4w9WgXcQ",
@@ -246,13 +476,10 @@ class TestVideosEndpoint:
                 created_at=datetime(2024, 1, 1),
             ),
         ]
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
-
-        resp = client.get("/channels/UC_test/videos")
+        resp = await client.get("/channels/UC_test/videos")
 
         assert resp.status_code == 200
-        data = resp.json()
+        data = _json(resp)
         assert data["channel_id"] == "UC_test"
         assert len(data["videos"]) == 1
         assert data["videos"][0]["video_id"] == "dQw4w9WgXcQ"
@@ -265,66 +492,80 @@ class TestVideosEndpoint:
 class TestSavedEndpoint:
     """Tests for GET /saved/{video_id}."""
 
-    @patch("yt_transcript_extractor.api.TranscriptStore")
-    def test_saved_text(self, MockStore: MagicMock, client: TestClient) -> None:
-        """Returns plain text for a saved transcript."""
-        mock_store = MagicMock()
+    @pytest.mark.parametrize(
+        ("url", "method", "store_value", "expected_body"),
+        [
+            pytest.param(
+                "/saved/dQw4w9WgXcQ",
+                "iter_transcript_text",
+                lambda: iter(["Hello world", "\nSecond line"]),
+                "Hello world\nSecond line",
+                id="text-default",
+            ),
+            pytest.param(
+                "/saved/dQw4w9WgXcQ?format=doc",
+                "get_transcript_doc",
+                lambda: "<details>\n<summary>00:00</summary>\n\nHello World\n\n</details>",
+                "<details>\n<summary>00:00</summary>\n\nHello World\n\n</details>",
+                id="doc",
+            ),
+        ],
+    )
+    async def test_saved_plain_text_formats(
+        self,
+        url: str,
+        method: str,
+        store_value,
+        expected_body: str,
+        mock_store: MagicMock,
+        client: httpx.AsyncClient,
+    ) -> None:
+        """text (default, streamed) and doc formats return plain-text bodies."""
         mock_store.has_video.return_value = True
-        mock_store.get_transcript_text.return_value = "Hello world\nSecond line"
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
-
-        resp = client.get("/saved/dQw4w9WgXcQ")
+        getattr(mock_store, method).return_value = store_value()
+        resp = await client.get(url)
 
         assert resp.status_code == 200
-        assert resp.text == "Hello world\nSecond line"
+        assert resp.text == expected_body
+        assert getattr(mock_store, method).call_args.args[0] == "dQw4w9WgXcQ"
 
-    @patch("yt_transcript_extractor.api.TranscriptStore")
-    def test_saved_json(self, MockStore: MagicMock, client: TestClient) -> None:
+    async def test_saved_json(self, mock_store: MagicMock, client: httpx.AsyncClient) -> None:
         """Returns JSON for a saved transcript when format=json."""
-        mock_store = MagicMock()
         mock_store.has_video.return_value = True
         mock_store.get_transcript.return_value = [
             {"text": "Hello", "start": 0.0, "duration": 1.0},
         ]
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
-
-        resp = client.get("/saved/dQw4w9WgXcQ?format=json")
+        resp = await client.get("/saved/dQw4w9WgXcQ?format=json")
 
         assert resp.status_code == 200
-        data = resp.json()
+        data = _json(resp)
         assert data["video_id"] == "dQw4w9WgXcQ"
         assert data["segment_count"] == 1
 
-    @patch("yt_transcript_extractor.api.TranscriptStore")
-    def test_saved_doc(self, MockStore: MagicMock, client: TestClient) -> None:
-        """Returns markdown doc for a saved transcript when format=doc."""
-        mock_store = MagicMock()
+    async def test_saved_etag_roundtrip(self, mock_store: MagicMock, client: httpx.AsyncClient) -> None:
+        """A repeat request with If-None-Match gets a bodiless 304."""
         mock_store.has_video.return_value = True
-        doc_output = "<details>\n<summary>00:00</summary>\n\nHello World\n\n</details>"
-        mock_store.get_transcript_doc.return_value = doc_output
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
-
-        resp = client.get("/saved/dQw4w9WgXcQ?format=doc")
-
-        assert resp.status_code == 200
-        assert resp.text == doc_output
-        mock_store.get_transcript_doc.assert_called_once_with("dQw4w9WgXcQ")
+        mock_store.get_transcript_hash.return_value = "abc123"
+        mock_store.get_transcript_doc.return_value = "doc body"
+        first = await client.get("/saved/dQw4w9WgXcQ?format=doc")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "public, max-age=86400"
+
+        second = await client.get(
+            "/saved/dQw4w9WgXcQ?format=doc",
+            headers={"If-None-Match": etag},
+        )
+        assert second.status_code == 304
+        assert second.text == ""
 
-    @patch("yt_transcript_extractor.api.TranscriptStore")
-    def test_saved_not_found(self, MockStore: MagicMock, client: TestClient) -> None:
+    async def test_saved_not_found(self, mock_store: MagicMock, client: httpx.AsyncClient) -> None:
         """Returns 404 when the video isn't in the database."""
-        mock_store = MagicMock()
         mock_store.has_video.return_value = False
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
-
-        resp = client.get("/saved/nonexistent1")
+        resp = await client.get("/saved/nonexistent1")
 
         assert resp.status_code == 404
-        assert "error" in resp.json()
+        assert "error" in _json(resp)
 
 
 # ---------------------------------------------------------------------------
@@ -334,48 +575,64 @@ class TestSavedEndpoint:
 class TestSearchEndpoint:
     """Tests for GET /search."""
 
-    @patch("yt_transcript_extractor.api.TranscriptStore")
-    def test_search_returns_results(self, MockStore: MagicMock, client: TestClient) -> None:
-        """Search returns matching segments with video context."""
-        mock_store = MagicMock()
-        mock_store.search_transcripts.return_value = [
-            {
-                "video_id": "dQw4w9WgXcQ",
-                "title": "Never Gonna Give You Up",
-                "channel_name": "Rick Astley",
-                "seq": 0,
-                "text": "Never gonna give you up",
-                "start": 0.0,
-                "duration": 2.5,
-            },
-        ]
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
-
-        resp = client.get("/search?q=never+gonna")
+    @pytest.mark.parametrize(
+        ("store_results", "expected_count"),
+        [
+            pytest.param(
+                [
+                    {
+                        "video_id": "dQw4w9WgXcQ",
+                        "title": "Never Gonna Give You Up",
+                        "channel_name": "Rick Astley",
+                        "seq": 0,
+                        "text": "Never gonna give you up",
+                        "start": 0.0,
+                        "duration": 2.5,
+                    },
+                ],
+                1,
+                id="match",
+            ),
+            pytest.param([], 0, id="no-match"),
+        ],
+    )
+    async def test_search_result_shape(
+        self,
+        store_results: list[dict],
+        expected_count: int,
+        mock_store: MagicMock,
+        client: httpx.AsyncClient,
+    ) -> None:
+        """Search echoes the query and returns the store's rows (or none)."""
+        mock_store.search_transcripts.return_value = store_results
+        resp = await client.get("/search?q=never+gonna")
 
         assert resp.status_code == 200
-        data = resp.json()
+        data = _json(resp)
         assert data["query"] == "never gonna"
-        assert data["result_count"] == 1
-        assert data["results"][0]["text"] == "Never gonna give you up"
-
-    @patch("yt_transcript_extractor.api.TranscriptStore")
-    def test_search_empty_results(self, MockStore: MagicMock, client: TestClient) -> None:
-        """Search returns empty list when nothing matches."""
-        mock_store = MagicMock()
-        mock_store.search_transcripts.return_value = []
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
+        assert data["result_count"] == expected_count
+        assert [r["text"] for r in data["results"]] == [r["text"] for r in store_results]
 
-        resp = client.get("/search?q=xyznonexistent")
+    async def test_search_pagination(self, mock_store: MagicMock, client: httpx.AsyncClient) -> None:
+        """A truncated page includes next_offset for fetching the next one."""
+        # The endpoint over-fetches by one row to detect truncation, so two
+        # rows back from the store with limit=1 means another page exists.
+        mock_store.search_transcripts.return_value = [
+            {"video_id": "dQw4w9WgXcQ", "title": "A", "channel_name": "C",
+             "seq": 0, "text": "first match", "start": 0.0, "duration": 1.0},
+            {"video_id": "dQw4w9WgXcQ", "title": "A", "channel_name": "C",
+             "seq": 1, "text": "second match", "start": 1.0, "duration": 1.0},
+        ]
+        resp = await client.get("/search?q=match&limit=1&offset=0")
 
         assert resp.status_code == 200
-        data = resp.json()
-        assert data["result_count"] == 0
-        assert data["results"] == []
+        data = _json(resp)
+        assert data["result_count"] == 1
+        assert data["results"][0]["text"] == "first match"
+        assert data["next_offset"] == 1
+        mock_store.search_transcripts.assert_called_once_with("match", 2, 0)
 
-    def test_search_missing_query_returns_422(self, client: TestClient) -> None:
+    async def test_search_missing_query_returns_422(self, client: httpx.AsyncClient) -> None:
         """Missing q parameter returns 422 validation error."""
-        resp = client.get("/search")
+        resp = await client.get("/search")
         assert resp.status_code == 422
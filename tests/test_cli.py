@@ -12,50 +12,40 @@ Covers:
 from __future__ import annotations
 
 import os
+import subprocess
+import sys
 from datetime import date
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
+from tests.conftest import FakeSnippet, _FakeTranscript, make_store_mock
 
 from yt_transcript_extractor.cli import (
     _auto_output_path,
     _sanitize_filename,
-    get,
     main,
-    saved,
 )
+from yt_transcript_extractor.cli_get import get
+from yt_transcript_extractor.cli_saved import saved
 from yt_transcript_extractor.metadata import VideoMetadata
 from yt_transcript_extractor.storage import TranscriptStore
 
 
 # ---------------------------------------------------------------------------
-# Helpers — reusable fake transcript builder (same pattern as other test files)
+# Helpers — fake transcript builder on top of the shared conftest fakes
 # ---------------------------------------------------------------------------
 
-class FakeSnippet:
-    """Mimics a FetchedTranscriptSnippet with .text, .start, .duration."""
-
-    def __init__(self, text: str, start: float, duration: float) -> None:
-        self.text = text
-        self.start = start
-        self.duration = duration
-
-
 def _make_fake_transcript(
     snippets_data: list[dict],
     language: str = "English",
     language_code: str = "en",
     is_generated: bool = False,
-) -> MagicMock:
-    """Build a mock FetchedTranscript that supports iteration and language attrs."""
+) -> _FakeTranscript:
+    """Build a fake FetchedTranscript that supports iteration and language attrs."""
     snippets = [FakeSnippet(**s) for s in snippets_data]
-    mock = MagicMock()
-    mock.__iter__ = MagicMock(return_value=iter(snippets))
-    mock.language = language
-    mock.language_code = language_code
-    mock.is_generated = is_generated
-    return mock
+    return _FakeTranscript(snippets, language, language_code, is_generated)
 
 
 _SAMPLE_SEGMENTS = [
@@ -63,6 +53,24 @@ _SAMPLE_SEGMENTS = [
     {"text": "Second line", "start": 5.0, "duration": 5.0},
 ]
 
+@pytest.fixture()
+def get_mocks(monkeypatch) -> SimpleNamespace:
+    """
+    Both mocks the dual-patched `get` tests need, installed in one fixture.
+
+    Replaces the stacked @patch decorators (and their easy-to-invert
+    argument ordering) with a single monkeypatch whose teardown is one
+    batched finalizer.  Tests read mocks.extract / mocks.auto_path.
+    """
+    mocks = SimpleNamespace(extract=MagicMock(), auto_path=MagicMock())
+    monkeypatch.setattr("yt_transcript_extractor.extractor.extract", mocks.extract)
+    monkeypatch.setattr("yt_transcript_extractor.cli_get._auto_output_path", mocks.auto_path)
+    return mocks
+
+
+# One shared fake transcript — reusable because iteration restarts each time.
+_SAMPLE_TRANSCRIPT = _make_fake_transcript(_SAMPLE_SEGMENTS)
+
 _SAMPLE_METADATA = VideoMetadata(
     video_id="dQw4w9WgXcQ",
     title="Never Gonna Give You Up",
@@ -81,76 +89,76 @@ _SAMPLE_METADATA = VideoMetadata(
 class TestSanitizeFilename:
     """Tests for the _sanitize_filename() helper that cleans unsafe characters."""
 
-    def test_replaces_colons(self) -> None:
-        """Colons (common in video titles like 'Part 1: Intro') become hyphens."""
-        assert _sanitize_filename("Part 1: Intro") == "Part 1- Intro"
-
-    def test_replaces_slashes(self) -> None:
-        """Forward slashes (e.g. 'AC/DC') become hyphens."""
-        assert _sanitize_filename("AC/DC") == "AC-DC"
-
-    def test_replaces_backslashes(self) -> None:
-        """Backslashes become hyphens."""
-        assert _sanitize_filename("path\\file") == "path-file"
-
-    def test_replaces_question_marks(self) -> None:
-        """Question marks (common in video titles) become hyphens."""
-        assert _sanitize_filename("What is this?") == "What is this-"
-
-    def test_replaces_asterisks(self) -> None:
-        """Asterisks become hyphens."""
-        assert _sanitize_filename("5* review") == "5- review"
-
-    def test_replaces_angle_brackets(self) -> None:
-        """Angle brackets become hyphens."""
-        assert _sanitize_filename("<hello>") == "-hello-"
-
-    def test_replaces_pipes(self) -> None:
-        """Pipe characters become hyphens."""
-        assert _sanitize_filename("A | B") == "A - B"
-
-    def test_replaces_double_quotes(self) -> None:
-        """Double quotes become hyphens."""
-        assert _sanitize_filename('Say "hello"') == "Say -hello-"
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            pytest.param("Part 1: Intro", "Part 1- Intro", id="colons"),
+            pytest.param("AC/DC", "AC-DC", id="slashes"),
+            pytest.param("path\\file", "path-file", id="backslashes"),
+            pytest.param("What is this?", "What is this-", id="question-marks"),
+            pytest.param("5* review", "5- review", id="asterisks"),
+            pytest.param("<hello>", "-hello-", id="angle-brackets"),
+            pytest.param("A | B", "A - B", id="pipes"),
+            pytest.param('Say "hello"', "Say -hello-", id="double-quotes"),
+            pytest.param("  hello  ", "hello", id="strips-whitespace"),
+            pytest.param(".hidden.", "hidden", id="strips-dots"),
+            pytest.param(
+                'A: B/C\\D?E*F<G>H|I"J', "A- B-C-D-E-F-G-H-I-J",
+                id="multiple-unsafe-chars",
+            ),
+            pytest.param(
+                "Normal Title - Part 2", "Normal Title - Part 2",
+                id="safe-string-unchanged",
+            ),
+            pytest.param("", "", id="empty-string"),
+        ],
+    )
+    def test_sanitize(self, raw: str, expected: str) -> None:
+        """Unsafe filesystem characters become hyphens; edges are stripped."""
+        assert _sanitize_filename(raw) == expected
 
-    def test_strips_leading_trailing_whitespace(self) -> None:
-        """Leading and trailing whitespace is stripped."""
-        assert _sanitize_filename("  hello  ") == "hello"
 
-    def test_strips_leading_trailing_dots(self) -> None:
-        """Leading and trailing dots are stripped (hidden files on POSIX)."""
-        assert _sanitize_filename(".hidden.") == "hidden"
+# ---------------------------------------------------------------------------
+# _auto_output_path — automatic output path from DB metadata
+# ---------------------------------------------------------------------------
 
-    def test_multiple_unsafe_chars(self) -> None:
-        """Multiple different unsafe characters in one string all get replaced."""
-        assert _sanitize_filename('A: B/C\\D?E*F<G>H|I"J') == "A- B-C-D-E-F-G-H-I-J"
+# Second saved video: unsafe characters in title and channel name, used to
+# exercise the sanitization path.
+_UNSAFE_METADATA = VideoMetadata(
+    video_id="test1234567",
+    title="What: Is This? A/B Test",
+    channel_id="UC_test",
+    channel_name="My <Channel>",
+    channel_url=None,
+    upload_date=date(2024, 1, 1),
+    duration_secs=60,
+)
 
-    def test_safe_string_unchanged(self) -> None:
-        """A string with no unsafe characters comes through unchanged."""
-        assert _sanitize_filename("Normal Title - Part 2") == "Normal Title - Part 2"
 
-    def test_empty_string(self) -> None:
-        """An empty string produces an empty string."""
-        assert _sanitize_filename("") == ""
+@pytest.fixture(scope="session")
+def populated_db():
+    """
+    One named in-memory DuckDB shared by all TestAutoOutputPath tests.
 
+    Schema creation and the two save_transcript() calls run once per
+    session; the tests themselves are read-only lookups.  A named
+    in-memory database (":memory:<name>") lives only while at least one
+    connection to it is open, so the populating store stays open for the
+    session while _auto_output_path() makes its own connection per lookup.
+    """
+    db_path = ":memory:auto_path_shared"
+    with TranscriptStore(db_path) as store:
+        store.save_transcript("dQw4w9WgXcQ", _SAMPLE_TRANSCRIPT, _SAMPLE_METADATA)
+        store.save_transcript("test1234567", _SAMPLE_TRANSCRIPT, _UNSAFE_METADATA)
+        yield db_path
 
-# ---------------------------------------------------------------------------
-# _auto_output_path — automatic output path from DB metadata
-# ---------------------------------------------------------------------------
 
 class TestAutoOutputPath:
     """Tests for _auto_output_path() which builds file paths from DB metadata."""
 
-    def test_returns_correct_path(self, tmp_path) -> None:
+    def test_returns_correct_path(self, populated_db: str) -> None:
         """Returns ~/Documents/yt-transcripts/{channel}/{title}.md for a saved video."""
-        db_path = str(tmp_path / "test.duckdb")
-
-        # Save a video so the DB has metadata to look up.
-        with TranscriptStore(db_path) as store:
-            transcript = _make_fake_transcript(_SAMPLE_SEGMENTS)
-            store.save_transcript("dQw4w9WgXcQ", transcript, _SAMPLE_METADATA)
-
-        result = _auto_output_path("dQw4w9WgXcQ", db_path)
+        result = _auto_output_path("dQw4w9WgXcQ", populated_db)
 
         assert result is not None
         # The path should end with the expected channel/title structure.
@@ -161,36 +169,14 @@ class TestAutoOutputPath:
         assert result.startswith(os.path.expanduser("~"))
         assert "yt-transcripts" in result
 
-    def test_returns_none_for_missing_video(self, tmp_path) -> None:
+    def test_returns_none_for_missing_video(self, populated_db: str) -> None:
         """Returns None when the video isn't in the database."""
-        db_path = str(tmp_path / "test.duckdb")
-
-        # Create an empty DB (no videos saved).
-        with TranscriptStore(db_path) as _:
-            pass
-
-        result = _auto_output_path("nonexistent1", db_path)
+        result = _auto_output_path("nonexistent1", populated_db)
         assert result is None
 
-    def test_sanitizes_unsafe_characters(self, tmp_path) -> None:
+    def test_sanitizes_unsafe_characters(self, populated_db: str) -> None:
         """Unsafe characters in title/channel are replaced with hyphens."""
-        db_path = str(tmp_path / "test.duckdb")
-
-        # Save a video with unsafe characters in title and channel name.
-        meta = VideoMetadata(
-            video_id="test1234567",
-            title="What: Is This? A/B Test",
-            channel_id="UC_test",
-            channel_name="My <Channel>",
-            channel_url=None,
-            upload_date=date(2024, 1, 1),
-            duration_secs=60,
-        )
-        with TranscriptStore(db_path) as store:
-            transcript = _make_fake_transcript(_SAMPLE_SEGMENTS)
-            store.save_transcript("test1234567", transcript, meta)
-
-        result = _auto_output_path("test1234567", db_path)
+        result = _auto_output_path("test1234567", populated_db)
 
         assert result is not None
         # Channel name's angle brackets should be replaced.
@@ -204,52 +190,52 @@ class TestAutoOutputPath:
 # ---------------------------------------------------------------------------
 
 class TestGetDefaults:
-    """Tests that the `get` subcommand has the right default option values."""
+    """
+    Tests that the `get` subcommand has the right default option values.
 
-    @patch("yt_transcript_extractor.cli.extract")
-    @patch("yt_transcript_extractor.cli._auto_output_path")
-    def test_defaults_to_doc_format_and_save_true(
-        self,
-        mock_auto_path: MagicMock,
-        mock_extract: MagicMock,
-    ) -> None:
+    These tests only assert on the arguments forwarded to extract(), so
+    they call the command's underlying callback directly instead of going
+    through CliRunner's IO-redirection and isolation machinery.  CliRunner
+    is still used wherever a test asserts on captured output.
+    """
+
+    def test_defaults_to_doc_format_and_save_true(self, get_mocks: SimpleNamespace) -> None:
         """
         Without explicit flags, `get` defaults to fmt='doc' and save=True.
 
-        We verify this by checking the arguments passed to extract().
+        The declared option defaults are read off the Click command and fed
+        to the callback — exactly what Click does when no flags are given —
+        then we check the arguments passed to extract().
         """
-        mock_extract.return_value = "<details>\n<summary>00:00</summary>\n\nHello world\n\n</details>"
+        get_mocks.extract.return_value = "<details>\n<summary>00:00</summary>\n\nHello world\n\n</details>"
         # Return None so it falls back to stdout (we don't want to write files
         # in tests).
-        mock_auto_path.return_value = None
+        get_mocks.auto_path.return_value = None
 
-        runner = CliRunner()
-        result = runner.invoke(main, ["get", "dQw4w9WgXcQ"])
+        defaults = {param.name: param.default for param in get.params}
+        defaults["video"] = "dQw4w9WgXcQ"
+        get.callback(**defaults)
 
-        assert result.exit_code == 0
         # extract() should have been called with fmt="doc" and save=True.
-        mock_extract.assert_called_once()
-        call_kwargs = mock_extract.call_args
-        assert call_kwargs[1]["fmt"] == "doc" or call_kwargs[0][2] == "doc" if len(call_kwargs[0]) > 2 else True
-        # Check via keyword args — extract() is called with keyword arguments
-        # in the CLI.
-        _, kwargs = mock_extract.call_args
+        get_mocks.extract.assert_called_once()
+        _, kwargs = get_mocks.extract.call_args
         assert kwargs.get("fmt") == "doc"
         assert kwargs.get("save") is True
 
-    @patch("yt_transcript_extractor.cli.extract")
+    @patch("yt_transcript_extractor.extractor.extract")
     def test_no_save_flag_disables_save(self, mock_extract: MagicMock) -> None:
-        """The --no-save flag sets save=False, reverting to old behavior."""
+        """Passing save=False reverts to the old no-persistence behavior."""
         mock_extract.return_value = "plain text output"
 
-        runner = CliRunner()
-        result = runner.invoke(main, ["get", "dQw4w9WgXcQ", "--no-save", "--format", "text"])
+        get.callback(
+            video="dQw4w9WgXcQ", fmt="text", lang=None, output=None,
+            save=False, pretty=None, db="unused.duckdb",
+        )
 
-        assert result.exit_code == 0
         _, kwargs = mock_extract.call_args
         assert kwargs.get("save") is False
 
-    @patch("yt_transcript_extractor.cli.extract")
+    @patch("yt_transcript_extractor.extractor.extract")
     def test_text_format_prints_to_stdout(self, mock_extract: MagicMock) -> None:
         """With --format text --no-save, output goes to stdout (no auto-path)."""
         mock_extract.return_value = "Hello world\nSecond line"
@@ -269,20 +255,13 @@ class TestGetDefaults:
 class TestGetAutoPath:
     """Tests for the auto-path file writing in the `get` subcommand."""
 
-    @patch("yt_transcript_extractor.cli._auto_output_path")
-    @patch("yt_transcript_extractor.cli.extract")
-    def test_writes_doc_to_auto_path(
-        self,
-        mock_extract: MagicMock,
-        mock_auto_path: MagicMock,
-        tmp_path,
-    ) -> None:
+    def test_writes_doc_to_auto_path(self, get_mocks: SimpleNamespace, tmp_path) -> None:
         """When fmt=doc and save=True, the transcript is written to auto-path."""
-        mock_extract.return_value = "<details>\n<summary>00:00</summary>\n\nHello world\n\n</details>"
+        get_mocks.extract.return_value = "<details>\n<summary>00:00</summary>\n\nHello world\n\n</details>"
         # No need to mock parse_video_id — it's a pure function that handles
         # bare 11-char IDs correctly, and "dQw4w9WgXcQ" is a valid ID.
         auto_file = str(tmp_path / "channel" / "title.html")
-        mock_auto_path.return_value = auto_file
+        get_mocks.auto_path.return_value = auto_file
 
         runner = CliRunner()
         result = runner.invoke(main, ["get", "dQw4w9WgXcQ"])
@@ -303,6 +282,116 @@ class TestGetAutoPath:
         assert "Transcript written to" in result.output
 
 
+# ---------------------------------------------------------------------------
+# CLI `get-many` subcommand — concurrent fetching
+# ---------------------------------------------------------------------------
+
+class TestGetMany:
+    """Tests for the `get-many` subcommand."""
+
+    @patch("yt_transcript_extractor.extractor.extract")
+    def test_fetches_all_videos(self, mock_extract: MagicMock) -> None:
+        """All given videos are extracted and their output printed."""
+        # Keyed on video id because fetches run concurrently.
+        mock_extract.side_effect = lambda video, **kwargs: f"transcript of {video}"
+
+        runner = CliRunner()
+        result = runner.invoke(main, [
+            "get-many", "dQw4w9WgXcQ", "oHg5SJYRHA0",
+            "--format", "text", "--no-save",
+        ])
+
+        assert result.exit_code == 0
+        assert mock_extract.call_count == 2
+        assert "transcript of dQw4w9WgXcQ" in result.output
+        assert "transcript of oHg5SJYRHA0" in result.output
+
+    @patch("yt_transcript_extractor.extractor.extract")
+    def test_failed_video_sets_exit_code(self, mock_extract: MagicMock) -> None:
+        """One failing video reports its error and exits non-zero."""
+        from yt_transcript_extractor.errors import VideoNotFoundError
+
+        def fake_extract(video: str, **kwargs):
+            if video == "badid1234ab":
+                raise VideoNotFoundError(video)
+            return f"transcript of {video}"
+
+        mock_extract.side_effect = fake_extract
+
+        runner = CliRunner()
+        result = runner.invoke(main, [
+            "get-many", "dQw4w9WgXcQ", "badid1234ab",
+            "--format", "text", "--no-save",
+        ])
+
+        assert result.exit_code == 1
+        # The good video still produced output.
+        assert "transcript of dQw4w9WgXcQ" in result.output
+        assert "badid1234ab" in result.output
+
+    @patch("yt_transcript_extractor.extractor.extract")
+    def test_json_output_respects_pipe_detection(self, mock_extract: MagicMock) -> None:
+        """JSON output is compact when piped and indented with --pretty, as in `get`."""
+        mock_extract.return_value = {"video_id": "dQw4w9WgXcQ", "segments": []}
+        runner = CliRunner()
+
+        # CliRunner's stdout is not a tty, so the default is the piped mode.
+        piped = runner.invoke(main, [
+            "get-many", "dQw4w9WgXcQ", "--format", "json", "--no-save",
+        ])
+        assert piped.exit_code == 0
+        assert piped.output.strip() == '{"video_id":"dQw4w9WgXcQ","segments":[]}'
+
+        pretty = runner.invoke(main, [
+            "get-many", "dQw4w9WgXcQ", "--format", "json", "--no-save", "--pretty",
+        ])
+        assert pretty.exit_code == 0
+        assert pretty.output.startswith('{\n  "video_id"')
+
+    @patch("yt_transcript_extractor.extractor.extract")
+    def test_malformed_argument_aborts_before_fetching(self, mock_extract: MagicMock) -> None:
+        """One unparseable URL/ID fails the invocation before any network fetch."""
+        runner = CliRunner()
+        result = runner.invoke(main, [
+            "get-many", "dQw4w9WgXcQ", "not-a-youtube-url", "--no-save",
+        ])
+
+        assert result.exit_code == 1
+        assert "not-a-youtube-url" in result.output
+        mock_extract.assert_not_called()
+
+    @patch("yt_transcript_extractor.metadata.fetch_video_metadata_cached")
+    @patch("yt_transcript_extractor.extractor.get_transcript")
+    def test_concurrent_saves_land_in_one_db(
+        self,
+        mock_get_transcript: MagicMock,
+        mock_fetch_meta: MagicMock,
+        tmp_path,
+    ) -> None:
+        """
+        Saving several videos concurrently stores every one of them.
+
+        The save phase runs for each video in its own worker thread, all
+        writing to the same database file — without serialisation DuckDB
+        aborts most of the overlapping transactions with a catalog
+        write-write conflict.
+        """
+        mock_get_transcript.return_value = _SAMPLE_TRANSCRIPT
+        mock_fetch_meta.return_value = _SAMPLE_METADATA
+
+        db = tmp_path / "many.duckdb"
+        runner = CliRunner()
+        result = runner.invoke(main, [
+            "get-many", "dQw4w9WgXcQ", "oHg5SJYRHA0",
+            "--format", "text", "--db", str(db),
+        ])
+
+        assert result.exit_code == 0
+        with TranscriptStore(str(db)) as store:
+            assert store.has_video("dQw4w9WgXcQ")
+            assert store.has_video("oHg5SJYRHA0")
+
+
 # ---------------------------------------------------------------------------
 # CLI `saved` subcommand — default option values
 # ---------------------------------------------------------------------------
@@ -310,8 +399,8 @@ class TestGetAutoPath:
 class TestSavedDefaults:
     """Tests that the `saved` subcommand has the right default option values."""
 
-    @patch("yt_transcript_extractor.cli._auto_output_path")
-    @patch("yt_transcript_extractor.cli.TranscriptStore")
+    @patch("yt_transcript_extractor.cli_saved._auto_output_path")
+    @patch("yt_transcript_extractor.storage.TranscriptStore")
     def test_defaults_to_doc_format(
         self,
         MockStore: MagicMock,
@@ -320,14 +409,15 @@ class TestSavedDefaults:
         """
         Without explicit --format, `saved` defaults to doc format.
 
-        We verify by checking that get_transcript_doc() is called (not
-        get_transcript_text() or get_transcript()).
+        We verify by checking that the title lookup for the doc header runs
+        (it's skipped for text/json) and that the segments are fetched once.
         """
-        mock_store = MagicMock()
-        mock_store.has_video.return_value = True
-        mock_store.get_transcript_doc.return_value = "<details>\n<summary>00:00</summary>\n\nHello\n\n</details>"
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
+        cm, mock_store = make_store_mock(
+            has_video=True,
+            get_transcript=[{"text": "Hello", "start": 0.0, "duration": 1.0}],
+            get_video_title_and_channel=("Title", "Channel"),
+        )
+        MockStore.return_value = cm
         # Return None so it falls back to stdout.
         mock_auto_path.return_value = None
 
@@ -335,10 +425,11 @@ class TestSavedDefaults:
         result = runner.invoke(main, ["saved", "dQw4w9WgXcQ"])
 
         assert result.exit_code == 0
-        # get_transcript_doc() should have been called (doc is the default).
-        mock_store.get_transcript_doc.assert_called_once_with("dQw4w9WgXcQ")
-        # get_transcript_text() should NOT have been called.
-        mock_store.get_transcript_text.assert_not_called()
+        # Segments are fetched exactly once, and the doc default triggers
+        # the title lookup.
+        mock_store.get_transcript.assert_called_once_with("dQw4w9WgXcQ")
+        mock_store.get_video_title_and_channel.assert_called_once_with("dQw4w9WgXcQ")
+        assert "<summary>" in result.output
 
 
 # ---------------------------------------------------------------------------
@@ -348,8 +439,8 @@ class TestSavedDefaults:
 class TestSavedAutoPath:
     """Tests for the auto-path file writing in the `saved` subcommand."""
 
-    @patch("yt_transcript_extractor.cli._auto_output_path")
-    @patch("yt_transcript_extractor.cli.TranscriptStore")
+    @patch("yt_transcript_extractor.cli_saved._auto_output_path")
+    @patch("yt_transcript_extractor.storage.TranscriptStore")
     def test_writes_doc_to_auto_path(
         self,
         MockStore: MagicMock,
@@ -357,11 +448,12 @@ class TestSavedAutoPath:
         tmp_path,
     ) -> None:
         """When fmt=doc (default), the transcript is written to auto-path."""
-        mock_store = MagicMock()
-        mock_store.has_video.return_value = True
-        mock_store.get_transcript_doc.return_value = "<details>\n<summary>00:00</summary>\n\nSaved content\n\n</details>"
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
+        cm, mock_store = make_store_mock(
+            has_video=True,
+            get_transcript=[{"text": "Saved content", "start": 0.0, "duration": 1.0}],
+            get_video_title_and_channel=("Title", "Channel"),
+        )
+        MockStore.return_value = cm
 
         auto_file = str(tmp_path / "channel" / "title.html")
         mock_auto_path.return_value = auto_file
@@ -374,7 +466,7 @@ class TestSavedAutoPath:
         assert os.path.exists(auto_file)
         with open(auto_file) as fh:
             content = fh.read()
-        assert "<summary>00:00</summary>" in content
+        assert "<summary>" in content
         assert "Saved content" in content
         # The transcript content should NOT appear in the combined output —
         # only confirmation messages (which go to stderr) should be there.
@@ -382,14 +474,17 @@ class TestSavedAutoPath:
         # Confirmation message should appear (via stderr).
         assert "Transcript written to" in result.output
 
-    @patch("yt_transcript_extractor.cli.TranscriptStore")
+    @patch("yt_transcript_extractor.storage.TranscriptStore")
     def test_text_format_prints_to_stdout(self, MockStore: MagicMock) -> None:
         """With --format text, output goes to stdout (no auto-path)."""
-        mock_store = MagicMock()
-        mock_store.has_video.return_value = True
-        mock_store.get_transcript_text.return_value = "Hello\nWorld"
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
+        cm, mock_store = make_store_mock(
+            has_video=True,
+            get_transcript=[
+                {"text": "Hello", "start": 0.0, "duration": 1.0},
+                {"text": "World", "start": 1.0, "duration": 1.0},
+            ],
+        )
+        MockStore.return_value = cm
 
         runner = CliRunner()
         result = runner.invoke(main, ["saved", "dQw4w9WgXcQ", "--format", "text"])
@@ -397,3 +492,74 @@ class TestSavedAutoPath:
         assert result.exit_code == 0
         assert "Hello" in result.output
         assert "World" in result.output
+
+
+# ---------------------------------------------------------------------------
+# CLI `repl` subcommand — single shared connection across commands
+# ---------------------------------------------------------------------------
+
+class TestRepl:
+    """Tests for the interactive repl subcommand."""
+
+    @patch("yt_transcript_extractor.storage.TranscriptStore")
+    def test_reuses_one_store_across_commands(self, MockStore: MagicMock) -> None:
+        """Two dispatched commands share the repl's single connection."""
+        cm, mock_store = make_store_mock(list_channels=[], search_transcripts=[])
+        MockStore.return_value = cm
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            ["repl"],
+            input="channels\nsearch hello\nexit\n",
+        )
+
+        assert result.exit_code == 0
+        # Only the repl itself opened a store; the subcommands used it.
+        MockStore.assert_called_once()
+        mock_store.list_channels.assert_called_once()
+        mock_store.search_transcripts.assert_called_once_with("hello")
+
+    @patch("yt_transcript_extractor.storage.TranscriptStore")
+    def test_bad_command_keeps_session_alive(self, MockStore: MagicMock) -> None:
+        """An unknown command reports an error but doesn't end the repl."""
+        cm, mock_store = make_store_mock(list_channels=[])
+        MockStore.return_value = cm
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            ["repl"],
+            input="bogus\nchannels\nexit\n",
+        )
+
+        assert result.exit_code == 0
+        # The command after the error still ran.
+        mock_store.list_channels.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Import cost
+# ---------------------------------------------------------------------------
+
+class TestImportCost:
+    """Tests that CLI startup stays free of heavy C-extension imports."""
+
+    def test_cli_import_skips_heavy_dependencies(self) -> None:
+        """Importing cli (as every invocation does) must not load yt-dlp or DuckDB.
+
+        The package __init__ resolves its re-exports lazily (PEP 562)
+        precisely so that `--help` and argument errors don't pay for the
+        yt_dlp/duckdb imports.  Run in a subprocess since this test
+        process has long since imported both.
+        """
+        code = (
+            "import sys\n"
+            "import yt_transcript_extractor.cli\n"
+            "leaked = [m for m in ('yt_dlp', 'duckdb') if m in sys.modules]\n"
+            "sys.exit(f'heavy modules imported: {leaked}' if leaked else 0)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr.strip()
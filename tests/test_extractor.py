@@ -12,6 +12,7 @@ Integration tests (need network, marked with @pytest.mark.integration):
 
 from __future__ import annotations
 
+from datetime import date
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -19,40 +20,42 @@ import pytest
 from yt_transcript_extractor.errors import (
     VideoNotFoundError,
 )
+from tests.conftest import FakeSnippet, _FakeTranscript, make_store_mock
+from yt_transcript_extractor.metadata import VideoMetadata
 from yt_transcript_extractor.extractor import (
     extract,
     format_doc,
     format_json,
     format_text,
     parse_video_id,
+    parse_video_ids,
 )
 
 
 # ---------------------------------------------------------------------------
-# Helpers — a fake FetchedTranscript for unit-testing formatters
+# Helpers — fake transcript builder on top of the shared conftest fakes
 # ---------------------------------------------------------------------------
 
-class FakeSnippet:
-    """Mimics FetchedTranscriptSnippet with .text, .start, .duration."""
+def _make_fake_transcript(snippets_data: list[dict]) -> _FakeTranscript:
+    """Build a fake FetchedTranscript from a list of dicts."""
+    return _FakeTranscript([FakeSnippet(**s) for s in snippets_data])
 
-    def __init__(self, text: str, start: float, duration: float) -> None:
-        self.text = text
-        self.start = start
-        self.duration = duration
 
+# Payloads shared by several formatter tests — built once per module since
+# the formatters only read the fakes and iteration restarts each time.
 
-def _make_fake_transcript(snippets_data: list[dict]) -> MagicMock:
-    """
-    Build a mock FetchedTranscript from a list of dicts.
+@pytest.fixture(scope="module")
+def empty_transcript() -> _FakeTranscript:
+    """A transcript with no segments."""
+    return _make_fake_transcript([])
 
-    The mock supports iteration (for format_text) and .to_raw_data()
-    (for format_json), matching the real FetchedTranscript interface.
-    """
-    snippets = [FakeSnippet(**s) for s in snippets_data]
-    mock = MagicMock()
-    mock.__iter__ = MagicMock(return_value=iter(snippets))
-    mock.to_raw_data = MagicMock(return_value=snippets_data)
-    return mock
+
+@pytest.fixture(scope="module")
+def single_segment_transcript() -> _FakeTranscript:
+    """A transcript with exactly one segment."""
+    return _make_fake_transcript([
+        {"text": "Only segment", "start": 0.0, "duration": 3.0},
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -62,52 +65,91 @@ def _make_fake_transcript(snippets_data: list[dict]) -> MagicMock:
 class TestParseVideoId:
     """Tests for parse_video_id covering every URL format + bare IDs."""
 
-    def test_standard_watch_url(self) -> None:
-        """Standard youtube.com/watch?v= URL."""
-        assert parse_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
-
-    def test_watch_url_with_extra_params(self) -> None:
-        """Watch URL with additional query parameters like playlist or timestamp."""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PLrAXtmErZgOeiKm4sgNOknGvNjby9efdf&t=42"
-        assert parse_video_id(url) == "dQw4w9WgXcQ"
-
-    def test_short_url(self) -> None:
-        """youtu.be short-link format."""
-        assert parse_video_id("https://youtu.be/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
-
-    def test_embed_url(self) -> None:
-        """youtube.com/embed/ URL used in iframes."""
-        assert parse_video_id("https://www.youtube.com/embed/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
-
-    def test_shorts_url(self) -> None:
-        """youtube.com/shorts/ URL."""
-        assert parse_video_id("https://www.youtube.com/shorts/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
-
-    def test_bare_id(self) -> None:
-        """Raw 11-character video ID with no URL wrapper."""
-        assert parse_video_id("dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            pytest.param(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ",
+                id="standard-watch-url",
+            ),
+            pytest.param(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PLrAXtmErZgOeiKm4sgNOknGvNjby9efdf&t=42",
+                "dQw4w9WgXcQ",
+                id="watch-url-with-extra-params",
+            ),
+            pytest.param("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ", id="short-url"),
+            pytest.param(
+                "https://www.youtube.com/embed/dQw4w9WgXcQ", "dQw4w9WgXcQ",
+                id="embed-url",
+            ),
+            pytest.param(
+                "https://www.youtube.com/shorts/dQw4w9WgXcQ", "dQw4w9WgXcQ",
+                id="shorts-url",
+            ),
+            pytest.param("dQw4w9WgXcQ", "dQw4w9WgXcQ", id="bare-id"),
+            pytest.param("  dQw4w9WgXcQ  ", "dQw4w9WgXcQ", id="bare-id-with-whitespace"),
+            pytest.param(
+                "http://youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ",
+                id="http-without-www",
+            ),
+            pytest.param("Ab_Cd-Ef_12", "Ab_Cd-Ef_12", id="hyphens-and-underscores"),
+        ],
+    )
+    def test_parses_to_id(self, url: str, expected: str) -> None:
+        """Every supported URL shape (and bare IDs) yields the 11-char ID."""
+        assert parse_video_id(url) == expected
+
+    @pytest.mark.parametrize(
+        "bad_input",
+        [
+            pytest.param("not-a-youtube-url", id="unrelated-string"),
+            pytest.param("", id="empty-string"),
+        ],
+    )
+    def test_invalid_input_raises(self, bad_input: str) -> None:
+        """Unparseable input raises VideoNotFoundError."""
+        with pytest.raises(VideoNotFoundError):
+            parse_video_id(bad_input)
 
-    def test_bare_id_with_whitespace(self) -> None:
-        """Bare ID with leading/trailing spaces should be trimmed."""
-        assert parse_video_id("  dQw4w9WgXcQ  ") == "dQw4w9WgXcQ"
 
-    def test_http_without_www(self) -> None:
-        """URL with http:// and no www prefix."""
-        assert parse_video_id("http://youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+# ---------------------------------------------------------------------------
+# parse_video_ids — bulk URL parsing
+# ---------------------------------------------------------------------------
 
-    def test_invalid_url_raises(self) -> None:
-        """Completely unrelated string should raise VideoNotFoundError."""
+class TestParseVideoIds:
+    """Tests for the streaming bulk parser behind get-many."""
+
+    def test_mixed_inputs_parse_in_order(self) -> None:
+        """URLs and bare IDs yield their 11-char IDs in input order."""
+        ids = list(parse_video_ids([
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "oHg5SJYRHA0",
+            "  https://youtu.be/Ab_Cd-Ef_12  ",
+        ]))
+        assert ids == ["dQw4w9WgXcQ", "oHg5SJYRHA0", "Ab_Cd-Ef_12"]
+
+    def test_invalid_input_raises_not_skips(self) -> None:
+        """A bad entry raises VideoNotFoundError; it is never silently dropped."""
+        generator = parse_video_ids(["dQw4w9WgXcQ", "not-a-youtube-url", "oHg5SJYRHA0"])
+        # Entries before the bad one still come through...
+        assert next(generator) == "dQw4w9WgXcQ"
+        # ...then parsing stops at the first unparseable input.
         with pytest.raises(VideoNotFoundError):
-            parse_video_id("not-a-youtube-url")
+            next(generator)
 
-    def test_empty_string_raises(self) -> None:
-        """Empty input should raise VideoNotFoundError."""
-        with pytest.raises(VideoNotFoundError):
-            parse_video_id("")
+    def test_streams_lazily(self) -> None:
+        """Inputs are only consumed as IDs are requested."""
+        consumed: list[str] = []
 
-    def test_id_with_hyphens_and_underscores(self) -> None:
-        """IDs can contain hyphens and underscores (base64url alphabet)."""
-        assert parse_video_id("Ab_Cd-Ef_12") == "Ab_Cd-Ef_12"
+        def tracking_inputs():
+            for text in ("dQw4w9WgXcQ", "oHg5SJYRHA0"):
+                consumed.append(text)
+                yield text
+
+        generator = parse_video_ids(tracking_inputs())
+        assert consumed == []
+        assert next(generator) == "dQw4w9WgXcQ"
+        assert consumed == ["dQw4w9WgXcQ"]
 
 
 # ---------------------------------------------------------------------------
@@ -126,17 +168,13 @@ class TestFormatText:
         result = format_text(transcript)
         assert result == "Hello world\nSecond line"
 
-    def test_empty_transcript(self) -> None:
+    def test_empty_transcript(self, empty_transcript: _FakeTranscript) -> None:
         """An empty transcript produces an empty string."""
-        transcript = _make_fake_transcript([])
-        assert format_text(transcript) == ""
+        assert format_text(empty_transcript) == ""
 
-    def test_single_segment(self) -> None:
+    def test_single_segment(self, single_segment_transcript: _FakeTranscript) -> None:
         """A transcript with one segment has no trailing newline."""
-        transcript = _make_fake_transcript([
-            {"text": "Only segment", "start": 0.0, "duration": 3.0},
-        ])
-        assert format_text(transcript) == "Only segment"
+        assert format_text(single_segment_transcript) == "Only segment"
 
 
 # ---------------------------------------------------------------------------
@@ -159,10 +197,9 @@ class TestFormatJson:
         assert result["segment_count"] == 2
         assert result["segments"] == data
 
-    def test_empty_segments(self) -> None:
+    def test_empty_segments(self, empty_transcript: _FakeTranscript) -> None:
         """Empty transcript produces segment_count 0 and empty list."""
-        transcript = _make_fake_transcript([])
-        result = format_json(transcript, "empty_vid")
+        result = format_json(empty_transcript, "empty_vid")
         assert result["segment_count"] == 0
         assert result["segments"] == []
 
@@ -197,6 +234,40 @@ class TestFormatDoc:
         assert "<title>My Video</title>" in result
         assert "<h1>My Video</h1>" in result
 
+    def test_fragment_omits_document_wrapper(self) -> None:
+        """full_document=False emits only the panels — no doctype, head, or CSS."""
+        transcript = _make_fake_transcript([
+            {"text": "Hello world", "start": 0.0, "duration": 5.0},
+        ])
+        fragment = format_doc(transcript, full_document=False)
+
+        assert "<details" in fragment
+        assert "<!DOCTYPE" not in fragment
+        assert "<style>" not in fragment
+        assert "</html>" not in fragment
+
+    def test_fragment_is_the_full_documents_body(self) -> None:
+        """
+        The full document is exactly the wrapper around the fragment.
+
+        This is what lets embedding callers stitch several fragments into
+        one page and pay for the document wrapper once.
+        """
+        transcript = _make_fake_transcript([
+            {"text": "Hello world", "start": 0.0, "duration": 5.0},
+            {"text": "Much later", "start": 60.0, "duration": 5.0},
+        ])
+        fragment = format_doc(transcript, full_document=False)
+        full = format_doc(transcript)
+
+        assert fragment in full
+        # Everything outside the fragment is wrapper — no panels live there.
+        assert "<details" not in full.replace(fragment, "", 1)
+
+    def test_fragment_empty_transcript(self, empty_transcript: _FakeTranscript) -> None:
+        """An empty transcript yields an empty fragment, same as the full mode."""
+        assert format_doc(empty_transcript, full_document=False) == ""
+
     def test_groups_segments_into_sections(self) -> None:
         """Segments within the same ~30s window are joined into one collapsible section."""
         transcript = _make_fake_transcript([
@@ -239,20 +310,16 @@ class TestFormatDoc:
         # 92 seconds = 1 minute 32 seconds
         assert "\"timestamp\">01:32</span>" in result
 
-    def test_single_segment(self) -> None:
+    def test_single_segment(self, single_segment_transcript: _FakeTranscript) -> None:
         """A transcript with one segment produces one collapsible section."""
-        transcript = _make_fake_transcript([
-            {"text": "Only segment", "start": 0.0, "duration": 3.0},
-        ])
-        result = format_doc(transcript)
+        result = format_doc(single_segment_transcript)
         assert "\"timestamp\">00:00</span>" in result
         assert "Only segment" in result
         assert result.count("<details>") == 1
 
-    def test_empty_transcript(self) -> None:
+    def test_empty_transcript(self, empty_transcript: _FakeTranscript) -> None:
         """An empty transcript produces an empty string."""
-        transcript = _make_fake_transcript([])
-        assert format_doc(transcript) == ""
+        assert format_doc(empty_transcript) == ""
 
     def test_accepts_list_of_dicts(self) -> None:
         """format_doc() also works with plain dicts (from stored segments)."""
@@ -343,8 +410,6 @@ class TestExtractWithSave:
         mock_get_transcript.return_value = fake_transcript
 
         # Set up mock metadata.
-        from yt_transcript_extractor.metadata import VideoMetadata
-        from datetime import date
         mock_metadata.return_value = VideoMetadata(
             video_id="dQw4w9WgXcQ",
             title="Test Video",
@@ -355,10 +420,9 @@ class TestExtractWithSave:
             duration_secs=60,
         )
 
-        # Set up mock store context manager.
-        mock_store_instance = MagicMock()
-        MockStore.return_value.__enter__ = MagicMock(return_value=mock_store_instance)
-        MockStore.return_value.__exit__ = MagicMock(return_value=False)
+        # Set up mock store context manager via the shared autospec factory.
+        cm, mock_store_instance = make_store_mock()
+        MockStore.return_value = cm
 
         result = extract("dQw4w9WgXcQ", save=True, db_path="/tmp/test.duckdb")
 
@@ -8,38 +8,96 @@ paths (DownloadError, None info_dict).
 
 from __future__ import annotations
 
-from datetime import date
-from unittest.mock import MagicMock, patch
+from datetime import date, datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 
 from yt_transcript_extractor.errors import MetadataFetchError
-from yt_transcript_extractor.metadata import VideoMetadata, fetch_video_metadata
+from yt_transcript_extractor import metadata as metadata_module
+from yt_transcript_extractor.metadata import (
+    VideoMetadata,
+    _get_ydl,
+    fetch_video_metadata,
+    fetch_video_metadata_cached,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_ydl_cache():
+    """Drop the shared YoutubeDL instance so each test gets its own mock."""
+    _get_ydl.cache_clear()
+    yield
+    _get_ydl.cache_clear()
+
+
+class _DownloadError(Exception):
+    """Stands in for yt_dlp.utils.DownloadError in the fake module."""
+
+
+class _FakeYDL:
+    """
+    Minimal YoutubeDL stand-in — a plain class instead of a MagicMock, so
+    extract_info is an ordinary method call rather than mock dispatch.
+
+    Tests configure it by setting .info (the dict extract_info returns) or
+    .error (an exception extract_info raises).
+    """
+
+    def __init__(self) -> None:
+        self.info: dict | None = None
+        self.error: Exception | None = None
+
+    def extract_info(self, url: str, **kwargs) -> dict | None:
+        if self.error is not None:
+            raise self.error
+        return self.info
+
+
+@pytest.fixture()
+def fake_ydl(monkeypatch) -> _FakeYDL:
+    """
+    Replace the yt_dlp module in metadata with lightweight concrete fakes.
+
+    The fake module exposes YoutubeDL (returning one shared _FakeYDL) and
+    utils.DownloadError (so the except clause in fetch_video_metadata
+    works).  Tests only set fake_ydl.info or fake_ydl.error.
+    """
+    ydl = _FakeYDL()
+    fake_module = SimpleNamespace(
+        YoutubeDL=lambda *args, **kwargs: ydl,
+        utils=SimpleNamespace(DownloadError=_DownloadError),
+    )
+    monkeypatch.setattr("yt_transcript_extractor.metadata.yt_dlp", fake_module)
+    return ydl
 
 
 # ---------------------------------------------------------------------------
 # Helpers — sample yt-dlp info dicts
 # ---------------------------------------------------------------------------
 
+# Base info_dict built once; MappingProxyType keeps tests from mutating the
+# shared defaults by accident.
+_BASE_INFO = MappingProxyType({
+    "id": "dQw4w9WgXcQ",
+    "title": "Rick Astley - Never Gonna Give You Up",
+    "channel_id": "UCuAXFkgsw1L7xaCfnd5JJOw",
+    "channel": "Rick Astley",
+    "uploader": "Rick Astley",
+    "channel_url": "https://www.youtube.com/channel/UCuAXFkgsw1L7xaCfnd5JJOw",
+    "upload_date": "20091025",
+    "duration": 213,
+})
+
+
 def _make_info_dict(**overrides) -> dict:
     """
     Build a realistic yt-dlp info_dict with sensible defaults.
 
-    Any key can be overridden via keyword arguments.  This avoids repeating
-    the full dict in every test.
+    Any key can be overridden via keyword arguments.  Each call returns an
+    independent dict, so tests are free to mutate their copy.
     """
-    base = {
-        "id": "dQw4w9WgXcQ",
-        "title": "Rick Astley - Never Gonna Give You Up",
-        "channel_id": "UCuAXFkgsw1L7xaCfnd5JJOw",
-        "channel": "Rick Astley",
-        "uploader": "Rick Astley",
-        "channel_url": "https://www.youtube.com/channel/UCuAXFkgsw1L7xaCfnd5JJOw",
-        "upload_date": "20091025",
-        "duration": 213,
-    }
-    base.update(overrides)
-    return base
+    return {**_BASE_INFO, **overrides}
 
 
 # ---------------------------------------------------------------------------
@@ -49,15 +107,11 @@ def _make_info_dict(**overrides) -> dict:
 class TestFetchVideoMetadata:
     """Tests for fetch_video_metadata() with mocked yt-dlp."""
 
-    @patch("yt_transcript_extractor.metadata.yt_dlp")
-    def test_full_metadata(self, mock_yt_dlp: MagicMock) -> None:
+    def test_full_metadata(self, fake_ydl: _FakeYDL) -> None:
         """All fields are populated when yt-dlp returns a complete info_dict."""
-        # Set up the mock: YoutubeDL() returns a context manager whose
-        # extract_info() returns our fake info dict.
-        mock_ydl_instance = MagicMock()
-        mock_ydl_instance.extract_info.return_value = _make_info_dict()
-        mock_yt_dlp.YoutubeDL.return_value.__enter__ = MagicMock(return_value=mock_ydl_instance)
-        mock_yt_dlp.YoutubeDL.return_value.__exit__ = MagicMock(return_value=False)
+        # The shared YoutubeDL() instance's extract_info() returns our fake
+        # info dict; everything else is pre-wired by the fixture.
+        fake_ydl.info = _make_info_dict()
 
         result = fetch_video_metadata("dQw4w9WgXcQ")
 
@@ -70,39 +124,27 @@ class TestFetchVideoMetadata:
         assert result.upload_date == date(2009, 10, 25)
         assert result.duration_secs == 213
 
-    @patch("yt_transcript_extractor.metadata.yt_dlp")
-    def test_missing_upload_date(self, mock_yt_dlp: MagicMock) -> None:
+    def test_missing_upload_date(self, fake_ydl: _FakeYDL) -> None:
         """upload_date is None when yt-dlp doesn't provide one (e.g. livestreams)."""
-        mock_ydl_instance = MagicMock()
-        mock_ydl_instance.extract_info.return_value = _make_info_dict(upload_date=None)
-        mock_yt_dlp.YoutubeDL.return_value.__enter__ = MagicMock(return_value=mock_ydl_instance)
-        mock_yt_dlp.YoutubeDL.return_value.__exit__ = MagicMock(return_value=False)
+        fake_ydl.info = _make_info_dict(upload_date=None)
 
         result = fetch_video_metadata("dQw4w9WgXcQ")
 
         assert result.upload_date is None
 
-    @patch("yt_transcript_extractor.metadata.yt_dlp")
-    def test_missing_duration(self, mock_yt_dlp: MagicMock) -> None:
+    def test_missing_duration(self, fake_ydl: _FakeYDL) -> None:
         """duration_secs is None when yt-dlp doesn't provide a duration."""
-        mock_ydl_instance = MagicMock()
-        mock_ydl_instance.extract_info.return_value = _make_info_dict(duration=None)
-        mock_yt_dlp.YoutubeDL.return_value.__enter__ = MagicMock(return_value=mock_ydl_instance)
-        mock_yt_dlp.YoutubeDL.return_value.__exit__ = MagicMock(return_value=False)
+        fake_ydl.info = _make_info_dict(duration=None)
 
         result = fetch_video_metadata("dQw4w9WgXcQ")
 
         assert result.duration_secs is None
 
-    @patch("yt_transcript_extractor.metadata.yt_dlp")
-    def test_falls_back_to_uploader(self, mock_yt_dlp: MagicMock) -> None:
+    def test_falls_back_to_uploader(self, fake_ydl: _FakeYDL) -> None:
         """channel_name falls back to 'uploader' when 'channel' key is missing."""
         info = _make_info_dict()
         del info["channel"]  # remove the primary channel name key
-        mock_ydl_instance = MagicMock()
-        mock_ydl_instance.extract_info.return_value = info
-        mock_yt_dlp.YoutubeDL.return_value.__enter__ = MagicMock(return_value=mock_ydl_instance)
-        mock_yt_dlp.YoutubeDL.return_value.__exit__ = MagicMock(return_value=False)
+        fake_ydl.info = info
 
         result = fetch_video_metadata("dQw4w9WgXcQ")
 
@@ -117,15 +159,9 @@ class TestFetchVideoMetadata:
 class TestFetchVideoMetadataErrors:
     """Tests for error handling in fetch_video_metadata()."""
 
-    @patch("yt_transcript_extractor.metadata.yt_dlp")
-    def test_download_error_raises_metadata_fetch_error(self, mock_yt_dlp: MagicMock) -> None:
+    def test_download_error_raises_metadata_fetch_error(self, fake_ydl: _FakeYDL) -> None:
         """yt-dlp DownloadError is wrapped in MetadataFetchError."""
-        # Create a real-looking DownloadError.
-        mock_yt_dlp.utils.DownloadError = type("DownloadError", (Exception,), {})
-        mock_ydl_instance = MagicMock()
-        mock_ydl_instance.extract_info.side_effect = mock_yt_dlp.utils.DownloadError("Video not found")
-        mock_yt_dlp.YoutubeDL.return_value.__enter__ = MagicMock(return_value=mock_ydl_instance)
-        mock_yt_dlp.YoutubeDL.return_value.__exit__ = MagicMock(return_value=False)
+        fake_ydl.error = _DownloadError("Video not found")
 
         with pytest.raises(MetadataFetchError) as exc_info:
             fetch_video_metadata("badid123456")
@@ -133,17 +169,68 @@ class TestFetchVideoMetadataErrors:
         assert "badid123456" in exc_info.value.message
         assert exc_info.value.http_status == 502
 
-    @patch("yt_transcript_extractor.metadata.yt_dlp")
-    def test_none_info_raises_metadata_fetch_error(self, mock_yt_dlp: MagicMock) -> None:
+    def test_none_info_raises_metadata_fetch_error(self, fake_ydl: _FakeYDL) -> None:
         """extract_info returning None raises MetadataFetchError."""
-        mock_ydl_instance = MagicMock()
-        mock_ydl_instance.extract_info.return_value = None
-        mock_yt_dlp.YoutubeDL.return_value.__enter__ = MagicMock(return_value=mock_ydl_instance)
-        mock_yt_dlp.YoutubeDL.return_value.__exit__ = MagicMock(return_value=False)
-        # Ensure DownloadError is defined so the except clause works.
-        mock_yt_dlp.utils.DownloadError = type("DownloadError", (Exception,), {})
+        fake_ydl.info = None
 
         with pytest.raises(MetadataFetchError) as exc_info:
             fetch_video_metadata("dQw4w9WgXcQ")
 
         assert "no info" in exc_info.value.message.lower()
+
+
+# ---------------------------------------------------------------------------
+# In-process cache TTL
+# ---------------------------------------------------------------------------
+
+class TestFetchVideoMetadataCachedTTL:
+    """Tests that the in-process metadata memo honors the TTL."""
+
+    @pytest.fixture()
+    def _isolated_caches(self, monkeypatch, tmp_path) -> None:
+        """Point both cache layers at empty, test-local state."""
+        monkeypatch.setattr(metadata_module, "_metadata_memo", {})
+        monkeypatch.setattr(
+            metadata_module,
+            "_METADATA_CACHE_PATH",
+            str(tmp_path / "metadata_cache.duckdb"),
+        )
+
+    def _stale_meta(self) -> VideoMetadata:
+        return VideoMetadata(
+            video_id="dQw4w9WgXcQ",
+            title="Stale Title",
+            channel_id="UCuAXFkgsw1L7xaCfnd5JJOw",
+            channel_name="Rick Astley",
+            channel_url=None,
+            upload_date=None,
+            duration_secs=None,
+        )
+
+    def test_fresh_memo_hit_skips_fetch(
+        self, fake_ydl: _FakeYDL, monkeypatch, _isolated_caches
+    ) -> None:
+        """A memo entry within the TTL is served without touching yt-dlp."""
+        meta = self._stale_meta()
+        metadata_module._metadata_memo["dQw4w9WgXcQ"] = (meta, datetime.now())
+        # Any real fetch would blow up immediately.
+        fake_ydl.error = _DownloadError("should not be called")
+
+        result = fetch_video_metadata_cached("dQw4w9WgXcQ")
+
+        assert result is meta
+
+    def test_expired_memo_entry_is_refetched(
+        self, fake_ydl: _FakeYDL, monkeypatch, _isolated_caches
+    ) -> None:
+        """A memo entry older than the TTL is dropped and fetched fresh."""
+        metadata_module._metadata_memo["dQw4w9WgXcQ"] = (
+            self._stale_meta(),
+            datetime.now() - timedelta(days=2),
+        )
+        fake_ydl.info = _make_info_dict()
+
+        result = fetch_video_metadata_cached("dQw4w9WgXcQ")
+
+        # The 24h default TTL has passed — the stale title must be gone.
+        assert result.title == "Rick Astley - Never Gonna Give You Up"